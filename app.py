@@ -5,20 +5,26 @@ chat, keyword alerts, sort, trending topics, briefing history.
 """
 
 import re
+import time
 import altair as alt
 import pandas as pd
 import streamlit as st
 from datetime import datetime, timezone
 
-from config import NEWS_SOURCES, OPENAI_API_KEY, SMTP_EMAIL, SMTP_PASSWORD, DIGEST_RECIPIENT
-from news_fetcher import fetch_all_news, fetch_article_body
+from config import FETCH_DEADLINE, OPENAI_API_KEY, SMTP_EMAIL, SMTP_PASSWORD, DIGEST_RECIPIENT
+from news_fetcher import stored_news, fetch_progress, body_cache_stats, search_cache_stats
+from presummarizer import stored_summary, summarize_stream, watch
+from source_registry import get_sources
+from scheduler import start_scheduler
 from summarizer import (
-    summarize_article, summarize_all, extract_trending_topics,
-    analyze_sentiment, chat_about_news,
+    summarize_all_stream, extract_trending_topics,
+    chat_about_news_stream, llm_cache_stats, sentiment_version, stored_sentiment,
 )
 from history import save_briefing, load_history
 from emailer import send_news_digest, was_digest_sent_today, get_last_send_info, get_send_history
 from health_check import run_all_checks
+import http_client
+import source_health
 
 # ── Page Config ───────────────────────────────────────────────────────────────
 st.set_page_config(
@@ -224,6 +230,42 @@ def _md(text: str) -> str:
 def _favicon(domain: str) -> str:
     return f"https://www.google.com/s2/favicons?sz=32&domain={domain}"
 
+def _card_html(article: dict, sent: str = "neutral", is_alerted: bool = False) -> str:
+    pub = ""
+    if article.get("published"):
+        pub = article["published"].strftime("%b %d, %H:%M")
+    fav = _favicon(article.get("domain", ""))
+    rt = article.get("reading_time", 1)
+    sent_cls = f"sentiment-{sent}"
+    dot_cls = {"positive": "pos", "negative": "neg", "neutral": "neu"}[sent]
+    alert_cls = " alert-match" if is_alerted else ""
+    alert_badge = '<span class="alert-badge">ALERT</span>' if is_alerted else ""
+    return (
+        f'<div class="card {sent_cls}{alert_cls}">'
+        f'<div class="card-header">'
+        f'<img class="card-favicon" src="{fav}" alt="">'
+        f'<span class="card-source"><span class="sentiment-dot {dot_cls}"></span>{article["source"]}</span>'
+        f'<span class="card-meta-right">{alert_badge}{pub}</span>'
+        f'</div>'
+        f'<div class="card-title"><a href="{article["url"]}" target="_blank">{article["title"]}</a></div>'
+        f'<div class="card-desc">{article.get("description", "")[:220]}</div>'
+        f'<div class="card-footer">'
+        f'<span class="card-tag">{article["category"]}</span>'
+        f'<span class="reading-time">&#128337; {rt} min read</span>'
+        f'</div></div>'
+    )
+
+def _stream_box(chunks, box_class: str, waiting: str) -> str:
+    """Render text into a styled box as it streams in; returns the full text."""
+    slot = st.empty()
+    slot.caption(waiting)
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        slot.markdown(f'<div class="{box_class}">{_md(text)}▌</div>', unsafe_allow_html=True)
+    slot.markdown(f'<div class="{box_class}">{_md(text)}</div>', unsafe_allow_html=True)
+    return text
+
 
 # ── Hero ──────────────────────────────────────────────────────────────────────
 st.markdown(
@@ -236,24 +278,36 @@ st.markdown(
 
 # ── Sidebar ───────────────────────────────────────────────────────────────────
 _smtp_ready = bool(SMTP_EMAIL and SMTP_PASSWORD)
+all_sources = get_sources()
+# Above this many sources the picker is a multiselect instead of checkboxes.
+_MAX_SOURCE_CHECKBOXES = 40
 
 with st.sidebar:
     st.markdown("## 📡 Controls")
 
     with st.expander("🌐 Sources", expanded=False):
-        all_source_names = [s["name"] for s in NEWS_SOURCES]
+        all_source_names = [s["name"] for s in all_sources]
         if "sel_sources" not in st.session_state:
             st.session_state.sel_sources = set(all_source_names)
-        for s in NEWS_SOURCES:
-            on = st.checkbox(s["name"], value=s["name"] in st.session_state.sel_sources, key=f"src_{s['name']}")
-            if on:
-                st.session_state.sel_sources.add(s["name"])
-            else:
-                st.session_state.sel_sources.discard(s["name"])
+        if len(all_sources) > _MAX_SOURCE_CHECKBOXES:
+            # One checkbox per feed does not scale to large OPML lists.
+            picked = st.multiselect(
+                "Sources", all_source_names,
+                default=[n for n in all_source_names if n in st.session_state.sel_sources],
+                key="src_multi", label_visibility="collapsed",
+            )
+            st.session_state.sel_sources = set(picked)
+        else:
+            for s in all_sources:
+                on = st.checkbox(s["name"], value=s["name"] in st.session_state.sel_sources, key=f"src_{s['name']}")
+                if on:
+                    st.session_state.sel_sources.add(s["name"])
+                else:
+                    st.session_state.sel_sources.discard(s["name"])
     selected_sources = list(st.session_state.sel_sources)
 
     with st.expander("📂 Categories", expanded=False):
-        all_categories = sorted(set(s["category"] for s in NEWS_SOURCES))
+        all_categories = sorted(set(s["category"] for s in all_sources))
         if "sel_categories" not in st.session_state:
             st.session_state.sel_categories = set(all_categories)
         for c in all_categories:
@@ -274,6 +328,8 @@ with st.sidebar:
         label_visibility="collapsed",
     )
     alert_keywords = [k.strip().lower() for k in alert_input.split(",") if k.strip()]
+    if alert_keywords:
+        watch(alert_keywords)
 
     st.markdown("---")
     if OPENAI_API_KEY:
@@ -290,30 +346,48 @@ with st.sidebar:
 
 
 # ── Fetch ─────────────────────────────────────────────────────────────────────
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_fetch(keys: tuple) -> list[dict]:
-    return fetch_all_news(selected_sources=list(keys))
+# Sources are refreshed by a background scheduler; page loads only read the store.
+@st.cache_resource(show_spinner=False)
+def _scheduler():
+    return start_scheduler()
+
+scheduler = _scheduler()
 
 def load_articles():
     if not selected_sources:
         return []
-    with st.spinner("Fetching latest tech news..."):
-        arts = _cached_fetch(tuple(sorted(selected_sources)))
-    return [a for a in arts if a["category"] in selected_categories]
+    # Copies, since summaries write fetched bodies back into article dicts.
+    return [a for a in stored_news(selected_sources=selected_sources)
+            if a["category"] in selected_categories]
+
+def _loaded_count(names: list[str]) -> int:
+    return sum(1 for r in scheduler.status() if r["source"] in names and r["last_status"] != "pending")
+
+@st.fragment(run_every=1)
+def _await_first_refresh(names: list[str], shown: int) -> None:
+    """Cold start only: rerun the page as the scheduler's first round lands."""
+    loaded = _loaded_count(names)
+    if loaded != shown or time.time() - st.session_state.first_load_at > FETCH_DEADLINE:
+        st.rerun()
+    st.caption(f"Fetching latest tech news... {loaded}/{len(names)} sources loaded")
 
 articles = load_articles()
+st.session_state.setdefault("first_load_at", time.time())
+if (selected_sources and not scheduler.refreshed(selected_sources)
+        and time.time() - st.session_state.first_load_at < FETCH_DEADLINE):
+    _await_first_refresh(selected_sources, _loaded_count(selected_sources))
 
 
 # ── Sentiment (cached) ───────────────────────────────────────────────────────
+# The background pass classifies headlines; rendering only reads the result.
 @st.cache_data(ttl=600, show_spinner=False)
-def _cached_sentiment(titles_joined: str) -> dict[str, str]:
-    titles = titles_joined.split(" ||| ")
-    return analyze_sentiment([{"title": t} for t in titles])
+def _cached_sentiment(items: tuple[tuple[str, str], ...], version: int) -> dict[str, str]:
+    """{article id: sentiment} for (id, title) pairs, as of sentiment `version`."""
+    return stored_sentiment([{"id": i, "title": t} for i, t in items])
 
 sentiment_map: dict[str, str] = {}
 if articles:
-    _sent_key = " ||| ".join(a["title"] for a in articles[:50])
-    sentiment_map = _cached_sentiment(_sent_key)
+    sentiment_map = _cached_sentiment(tuple((a["id"], a["title"]) for a in articles), sentiment_version())
 
 
 # ── Alert matching helper ─────────────────────────────────────────────────────
@@ -323,14 +397,15 @@ def _is_alert(article: dict) -> bool:
     text = (article["title"] + " " + article.get("description", "")).lower()
     return any(kw in text for kw in alert_keywords)
 
-alert_count = sum(1 for a in articles if _is_alert(a))
+alerted_ids = {a["id"] for a in articles if _is_alert(a)}
+alert_count = len(alerted_ids)
 
 # Show alert feedback in sidebar
 if alert_keywords and articles:
     with st.sidebar:
         if alert_count > 0:
             st.success(f"🔔 {alert_count} article{'s' if alert_count != 1 else ''} match your keywords!", icon="🔔")
-            matched = [a for a in articles if _is_alert(a)]
+            matched = [a for a in articles if a["id"] in alerted_ids]
             for m in matched[:5]:
                 st.caption(f"• {m['title'][:80]}")
             if alert_count > 5:
@@ -419,9 +494,10 @@ with tab_briefing:
     st.caption("AI-generated executive summary with top stories, trends, and market signals.")
 
     if st.button("Generate Briefing", type="primary", use_container_width=True):
-        with st.spinner("Analyzing headlines and generating briefing..."):
-            briefing = summarize_all(articles)
-        st.markdown(f'<div class="briefing-box">{_md(briefing)}</div>', unsafe_allow_html=True)
+        briefing = _stream_box(
+            summarize_all_stream(articles), "briefing-box",
+            "Analyzing headlines and generating briefing...",
+        )
         # Save to history
         save_briefing(briefing, len(articles))
     else:
@@ -494,53 +570,21 @@ with tab_articles:
         for idx, article in enumerate(filtered):
             col = col_left if idx % 2 == 0 else col_right
             with col:
-                pub = ""
-                if article.get("published"):
-                    pub = article["published"].strftime("%b %d, %H:%M")
-                domain = article.get("domain", "")
-                fav = _favicon(domain)
-                rt = article.get("reading_time", 1)
-
-                # Sentiment
-                sent = sentiment_map.get(article["title"], "neutral")
-                sent_cls = f"sentiment-{sent}"
-                dot_cls = {"positive": "pos", "negative": "neg", "neutral": "neu"}[sent]
-
-                # Alert
-                is_alerted = _is_alert(article)
-                alert_cls = " alert-match" if is_alerted else ""
-
-                alert_badge = ""
-                if is_alerted:
-                    alert_badge = '<span class="alert-badge">ALERT</span>'
-
-                st.markdown(
-                    f'<div class="card {sent_cls}{alert_cls}">'
-                    f'<div class="card-header">'
-                    f'<img class="card-favicon" src="{fav}" alt="">'
-                    f'<span class="card-source"><span class="sentiment-dot {dot_cls}"></span>{article["source"]}</span>'
-                    f'<span class="card-meta-right">{alert_badge}{pub}</span>'
-                    f'</div>'
-                    f'<div class="card-title"><a href="{article["url"]}" target="_blank">{article["title"]}</a></div>'
-                    f'<div class="card-desc">{article.get("description", "")[:220]}</div>'
-                    f'<div class="card-footer">'
-                    f'<span class="card-tag">{article["category"]}</span>'
-                    f'<span class="reading-time">&#128337; {rt} min read</span>'
-                    f'</div></div>',
-                    unsafe_allow_html=True)
+                sent = sentiment_map.get(article["id"], "neutral")
+                st.markdown(_card_html(article, sent, article["id"] in alerted_ids), unsafe_allow_html=True)
 
                 with st.expander("🤖 AI Summary", expanded=False):
-                    sk = f"sum_{idx}"
+                    sk = f"sum_{article['id']}"
+                    if sk not in st.session_state:
+                        # Top stories are summarized in the background after each refresh.
+                        ready = stored_summary(article)
+                        if ready is not None:
+                            st.session_state[sk] = ready
                     if sk not in st.session_state:
-                        if st.button("Summarize", key=f"btn_{idx}"):
-                            with st.spinner("Summarizing..."):
-                                if len(article.get("content", "")) < 200:
-                                    body = fetch_article_body(article["url"])
-                                    if body:
-                                        article["content"] = body
-                                s = summarize_article(article)
-                                st.session_state[sk] = s
-                            st.markdown(f'<div class="summary-box">{_md(s)}</div>', unsafe_allow_html=True)
+                        if st.button("Summarize", key=f"btn_{article['id']}"):
+                            st.session_state[sk] = _stream_box(
+                                summarize_stream(article), "summary-box", "Summarizing...",
+                            )
                     else:
                         st.markdown(f'<div class="summary-box">{_md(st.session_state[sk])}</div>', unsafe_allow_html=True)
 
@@ -627,6 +671,74 @@ with tab_analytics:
     else:
         st.info("Click **Check App Health** to ping all services and see their status.", icon="💡")
 
+    # ── Feed circuit breakers ─────────────────────────────────────────────────
+    st.markdown("#### ⚡ Feed Reliability")
+    breaker_rows = source_health.snapshot()
+    if breaker_rows:
+        _state_labels = {"closed": "🟢 Closed", "half_open": "🟡 Probing", "open": "🔴 Open"}
+        _schedule = {r["source"]: r for r in scheduler.status()}
+        st.dataframe(
+            [{
+                "Source": r["source"],
+                "Circuit": _state_labels.get(r["state"], r["state"]),
+                "Last refresh": (
+                    _schedule[r["source"]]["last_refresh"].strftime("%H:%M:%S UTC")
+                    if r["source"] in _schedule and _schedule[r["source"]]["last_refresh"] else "—"
+                ),
+                "Next refresh (s)": _schedule[r["source"]]["next_in_s"] if r["source"] in _schedule else "—",
+                "p95 (ms)": r["p95_ms"] if r["p95_ms"] is not None else "—",
+                "Timeout (s)": r["timeout_s"],
+                "Error rate": f"{r['error_rate']:.0%}",
+                "Failures in a row": r["consecutive_failures"],
+                "Retry in (s)": r["retry_in_s"] or "—",
+                "Last error": r["last_error"] or "—",
+            } for r in breaker_rows],
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption("Sources with an open circuit are skipped and served from their last stored articles until a probe succeeds.")
+    else:
+        st.caption("No feed fetches recorded yet.")
+
+    shard_rows = fetch_progress()
+    if len(shard_rows) > 1:
+        st.markdown("##### Refresh progress by shard")
+        st.dataframe(
+            [{
+                "Shard": r["shard"],
+                "Sources": r["sources"],
+                "Refreshed": f"{r['refreshed']}/{r['sources']}",
+                "In flight": r["in_flight"],
+                "Failing": r["failed"],
+                "Last finished": r["last_done"].strftime("%H:%M:%S UTC") if r["last_done"] else "—",
+            } for r in shard_rows],
+            use_container_width=True,
+            hide_index=True,
+        )
+
+    llm_stats = llm_cache_stats()
+    st.caption(
+        f"🧠 AI response cache: {llm_stats['hit_rate']:.0%} hit rate "
+        f"({llm_stats['hits']} hits, {llm_stats['misses']} misses since start) · "
+        f"{llm_stats['entries']} stored, {llm_stats['bytes'] / 1024:.0f} KB"
+    )
+    body_stats = body_cache_stats()
+    search_stats = search_cache_stats()
+    st.caption(
+        f"📄 Article text cache: {body_stats['hits']} hits, {body_stats['misses']} misses, "
+        f"{body_stats['evictions']} evicted · {body_stats['entries']} stored, "
+        f"{body_stats['bytes'] / 1024:.0f} KB"
+        f" · 🔎 Web search cache: {search_stats['hits']} hits, {search_stats['misses']} misses, "
+        f"{search_stats['coalesced']} joined in-flight"
+    )
+    http_stats = http_client.get_stats().values()
+    wire = sum(s["wire_bytes"] for s in http_stats)
+    body = sum(s["body_bytes"] for s in http_stats)
+    st.caption(
+        f"🌐 Network: {sum(s['requests'] for s in http_stats)} requests to {len(http_stats)} hosts "
+        f"since start · {wire / 1024:.0f} KB transferred for {body / 1024:.0f} KB of content"
+    )
+
     # ── Charts ────────────────────────────────────────────────────────────────
     st.markdown("---")
     st.markdown("#### 📊 News Analytics")
@@ -697,7 +809,7 @@ with tab_analytics:
             if sentiment_map:
                 sent_data = []
                 for a in articles:
-                    s = sentiment_map.get(a["title"], "neutral")
+                    s = sentiment_map.get(a["id"], "neutral")
                     sent_data.append({"Source": a["source"], "Sentiment": s.capitalize()})
                 sent_df = pd.DataFrame(sent_data)
                 color_scale = alt.Scale(
@@ -732,7 +844,7 @@ with tab_chat:
                     f'<div class="chat-brief">{result["brief"]}</div>',
                     unsafe_allow_html=True,
                 )
-            for art_idx, art in enumerate(result["matched_articles"]):
+            for art in result["matched_articles"]:
                 st.markdown(
                     f'<div class="chat-article-link">'
                     f'<span>📰</span>'
@@ -741,20 +853,16 @@ with tab_chat:
                     f'</div>',
                     unsafe_allow_html=True,
                 )
-                summary_key = f"chat_sum_{msg_idx}_{art_idx}"
+                # Shared with the article cards, so a summary is made once per article.
+                summary_key = f"sum_{art['id']}"
+                if summary_key not in st.session_state:
+                    ready = stored_summary(art)
+                    if ready is not None:
+                        st.session_state[summary_key] = ready
                 if summary_key not in st.session_state:
-                    if st.button("📝 Get Summary", key=f"btn_cs_{msg_idx}_{art_idx}"):
-                        with st.spinner("Generating summary..."):
-                            art_copy = dict(art)
-                            if len(art_copy.get("content", "")) < 200:
-                                body = fetch_article_body(art_copy["url"])
-                                if body:
-                                    art_copy["content"] = body
-                            summary = summarize_article(art_copy)
-                            st.session_state[summary_key] = summary
-                        st.markdown(
-                            f'<div class="summary-box">{_md(summary)}</div>',
-                            unsafe_allow_html=True,
+                    if st.button("📝 Get Summary", key=f"btn_cs_{msg_idx}_{art['id']}"):
+                        st.session_state[summary_key] = _stream_box(
+                            summarize_stream(art), "summary-box", "Generating summary...",
                         )
                 else:
                     st.markdown(
@@ -817,12 +925,21 @@ with tab_chat:
             st.markdown(prompt)
 
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                history_for_ai = [
-                    {"role": h["role"], "content": h["content"]}
-                    for h in st.session_state.chat_history[:-1]
-                ]
-                result = chat_about_news(articles, prompt, history_for_ai)
+            history_for_ai = [
+                {"role": h["role"], "content": h["content"]}
+                for h in st.session_state.chat_history[:-1]
+            ]
+            # The answer streams in as plain text, then is redrawn with its links.
+            live = st.empty()
+            live.caption("Thinking...")
+            answer = ""
+            for part in chat_about_news_stream(articles, prompt, history_for_ai):
+                if isinstance(part, dict):
+                    result = part
+                else:
+                    answer += part
+                    live.markdown(answer + "▌")
+            live.empty()
             _render_chat_response(result, len(st.session_state.chat_history))
 
         st.session_state.chat_history.append({
@@ -0,0 +1,452 @@
+"""
+Article Store — Persistent per-source article index keyed by canonical URL.
+Each refresh merges only new or changed entries and reports which articles
+were added and removed, so ingestion work scales with the delta. Also defines
+Article, the compact record every fetcher produces.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlencode
+
+STORE_FILE = os.path.join(os.path.dirname(__file__), "article_store.sqlite3")
+# Whole-store JSON written by earlier versions; imported once, then removed.
+LEGACY_STORE_FILE = os.path.join(os.path.dirname(__file__), "article_store.json")
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src", "cmpid", "guccounter"}
+
+
+# ── Keys ──────────────────────────────────────────────────────────────────────
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so the same story maps to one key.
+
+    Lowercases scheme and host, drops "www.", the fragment, tracking query
+    parameters and any trailing slash. Uses plain string splitting because
+    it runs for every article on every refresh.
+    """
+    url = (url or "").strip()
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return url
+    rest = rest.partition("#")[0]
+    rest, _, query = rest.partition("?")
+    host, _, path = rest.partition("/")
+    host = host.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = "/" + path.rstrip("/")
+    if query:
+        query = urlencode(sorted(
+            (k, v) for k, v in parse_qsl(query, keep_blank_values=True)
+            if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+        ))
+    canonical = f"{scheme.lower()}://{host}{path}"
+    return f"{canonical}?{query}" if query else canonical
+
+
+def entry_key(url: str, title: str = "") -> str:
+    """Store key for an entry: its canonical URL, or the title if it has none."""
+    return canonical_url(url) or title
+
+
+def fingerprint(*fields: str) -> str:
+    """Hash the raw inputs of an entry; a changed hash means re-processing."""
+    h = hashlib.sha1()
+    for f in fields:
+        h.update((f or "").encode("utf-8", "replace"))
+        h.update(b"\x1f")
+    return h.hexdigest()[:16]
+
+
+def article_id(url: str, title: str = "") -> str:
+    """Stable ID for an article: a hash of its canonical URL (or title)."""
+    return fingerprint(entry_key(url, title))
+
+
+# ── Model ─────────────────────────────────────────────────────────────────────
+
+# Keys that only some sources set; absent from keys() when unset, as in a dict.
+_OPTIONAL = ("score", "comments")
+_FIELDS = (
+    "id", "title", "url", "description", "content", "published",
+    "source", "category", "domain", "reading_time",
+)
+_FIELD_SET = frozenset(_FIELDS + _OPTIONAL)
+
+
+class Article:
+    """One article, stored compactly.
+
+    Uses __slots__ instead of a per-instance dict, interns the source,
+    category and domain strings, and keeps description as a length into
+    content when it is a prefix of it (the common case, since content falls
+    back to the description). Supports dict-style access (a["title"],
+    a.get(...), dict(a)) so existing callers keep working; keys outside the
+    model land in a small side dict.
+    """
+
+    __slots__ = (
+        "id", "title", "url", "_description", "_content", "published",
+        "source", "category", "domain", "reading_time", "score", "comments",
+        "_extra",
+    )
+
+    def __init__(
+        self,
+        title: str = "",
+        url: str = "",
+        description: str = "",
+        content: str = "",
+        published: datetime | None = None,
+        source: str = "",
+        category: str = "",
+        domain: str = "",
+        reading_time: int = 0,
+        score: int | None = None,
+        comments: int | None = None,
+        **extra,
+    ):
+        extra.pop("id", None)
+        self.title = title
+        self.url = url
+        self._content = content or ""
+        self._description = ""
+        self.description = description or ""
+        self.published = published
+        self.source = sys.intern(source or "")
+        self.category = sys.intern(category or "")
+        self.domain = sys.intern(domain or "")
+        self.reading_time = reading_time
+        self.score = score
+        self.comments = comments
+        self._extra = extra or None
+        self.id = article_id(url, title)
+
+    @property
+    def description(self) -> str:
+        d = self._description
+        return self._content[:d] if isinstance(d, int) else d
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = len(value) if value and self._content.startswith(value) else value
+
+    @property
+    def content(self) -> str:
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        description = self.description
+        self._content = value or ""
+        self.description = description
+
+    # ── Dict-style access ──
+
+    def __getitem__(self, key: str):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            if value is None and key in _OPTIONAL:
+                raise KeyError(key)
+            return value
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key == "id":
+            raise KeyError("id is derived from the URL")
+        if key in _FIELD_SET:
+            if key in ("source", "category", "domain"):
+                value = sys.intern(value or "")
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> list[str]:
+        keys = list(_FIELDS)
+        keys.extend(k for k in _OPTIONAL if getattr(self, k) is not None)
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def items(self) -> list[tuple]:
+        return [(k, self[k]) for k in self.keys()]
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    def copy(self) -> "Article":
+        """Shallow copy; text is shared, only the record itself is new."""
+        clone = Article.__new__(Article)
+        for slot in Article.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        if self._extra:
+            clone._extra = dict(self._extra)
+        return clone
+
+    def __repr__(self) -> str:
+        return f"Article(id={self.id!r}, source={self.source!r}, title={self.title[:40]!r})"
+
+
+# ── Serialization ─────────────────────────────────────────────────────────────
+
+def _to_json(article: Article) -> dict:
+    data = article.to_dict()
+    if isinstance(data.get("published"), datetime):
+        data["published"] = data["published"].isoformat()
+    return data
+
+
+def _from_json(data: dict) -> Article:
+    data = dict(data)
+    if data.get("published"):
+        try:
+            data["published"] = datetime.fromisoformat(data["published"])
+        except (TypeError, ValueError):
+            data["published"] = None
+    return Article(**data)
+
+
+def _sort_key(article: Article) -> datetime:
+    return article.get("published") or datetime.min.replace(tzinfo=timezone.utc)
+
+
+# ── Store ─────────────────────────────────────────────────────────────────────
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    source  TEXT NOT NULL,
+    key     TEXT NOT NULL,
+    fp      TEXT NOT NULL,
+    article TEXT NOT NULL,
+    PRIMARY KEY (source, key)
+);
+"""
+
+# Most added / removed articles kept between take_delta() calls; older ones
+# are dropped.
+_DELTA_LIMIT = 5000
+
+
+class ArticleStore:
+    """Per-source {canonical_url: (fingerprint, article)} map persisted in SQLite.
+
+    Each article is one row, so a save writes only the rows that changed
+    since the last one.
+    """
+
+    def __init__(self, path: str = STORE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._sources: dict[str, dict[str, tuple[str, Article]]] = {}
+        self._sorted: dict[str, list[Article]] = {}
+        self._versions: dict[str, int] = {}
+        # None until take_delta() is first called; nothing is recorded before.
+        self._pending: dict[str, deque] | None = None
+        # source -> {key: (fp, article) to write, or None to delete}
+        self._changes: dict[str, dict[str, tuple[str, Article] | None]] = {}
+        self._load()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _load(self) -> None:
+        try:
+            rows = self._db().execute("SELECT source, key, fp, article FROM articles").fetchall()
+        except Exception as e:
+            print(f"[WARNING] Failed to load article store: {e}")
+            return
+        for source, key, fp, article in rows:
+            try:
+                self._sources.setdefault(source, {})[key] = (fp, _from_json(json.loads(article)))
+            except Exception:
+                continue
+        if not rows:
+            self._import_legacy()
+        for source in self._sources:
+            self._resort(source)
+
+    def _import_legacy(self) -> None:
+        """Move a store saved by the old whole-file JSON format into SQLite."""
+        if not os.path.exists(LEGACY_STORE_FILE):
+            return
+        try:
+            with open(LEGACY_STORE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return
+        if not isinstance(data, dict):
+            return
+        for source, entries in data.items():
+            self._sources[source] = {
+                key: (rec["fp"], _from_json(rec["article"]))
+                for key, rec in entries.items()
+            }
+            self._changes[source] = dict(self._sources[source])
+        self.save()
+        if not self._changes:
+            try:
+                os.remove(LEGACY_STORE_FILE)
+            except OSError:
+                pass
+
+    def save(self) -> None:
+        """Write the articles changed since the last save."""
+        with self._save_lock:
+            with self._lock:
+                changes, self._changes = self._changes, {}
+            if not changes:
+                return
+            upserts, deletes = [], []
+            for source, entries in changes.items():
+                for key, rec in entries.items():
+                    if rec is None:
+                        deletes.append((source, key))
+                    else:
+                        fp, article = rec
+                        upserts.append((source, key, fp,
+                                        json.dumps(_to_json(article), ensure_ascii=False)))
+            try:
+                db = self._db()
+                db.execute("BEGIN")
+                try:
+                    db.executemany("DELETE FROM articles WHERE source = ? AND key = ?", deletes)
+                    db.executemany(
+                        "INSERT OR REPLACE INTO articles (source, key, fp, article) VALUES (?, ?, ?, ?)",
+                        upserts,
+                    )
+                    db.execute("COMMIT")
+                except Exception:
+                    db.execute("ROLLBACK")
+                    raise
+            except Exception as e:
+                print(f"[WARNING] Failed to save article store: {e}")
+                # Keep the unsaved rows for the next attempt, unless a newer
+                # merge has replaced them meanwhile.
+                with self._lock:
+                    for source, entries in changes.items():
+                        pending = self._changes.setdefault(source, {})
+                        for key, rec in entries.items():
+                            pending.setdefault(key, rec)
+
+    def _resort(self, source: str) -> None:
+        articles = [a for _, a in self._sources.get(source, {}).values()]
+        articles.sort(key=_sort_key, reverse=True)
+        self._sorted[source] = articles
+        self._versions[source] = self._versions.get(source, 0) + 1
+
+    def lookup(self, source: str, key: str, fp: str) -> Article | None:
+        """Return a copy of the stored article if its fingerprint is unchanged."""
+        with self._lock:
+            rec = self._sources.get(source, {}).get(key)
+        if rec is None or rec[0] != fp:
+            return None
+        return rec[1].copy()
+
+    def fingerprints(self, source: str) -> dict[str, str]:
+        """{entry key: fingerprint} for a source's stored articles."""
+        with self._lock:
+            return {key: fp for key, (fp, _) in self._sources.get(source, {}).items()}
+
+    def merge(self, source: str, articles: list[tuple[str, Article]]) -> dict:
+        """Replace a source's articles with the latest fetch.
+
+        articles is a list of (fingerprint, article). Returns
+        {"added": [...], "removed": [...]} relative to the previous state.
+        An empty fetch is treated as a failure and leaves the source as is.
+        """
+        if not articles:
+            return {"added": [], "removed": []}
+        incoming: dict[str, tuple[str, Article]] = {}
+        for fp, article in articles:
+            key = entry_key(article.get("url", ""), article.get("title", ""))
+            incoming.setdefault(key, (fp, article))
+
+        with self._lock:
+            previous = self._sources.get(source, {})
+            changes = {k: rec for k, rec in incoming.items()
+                       if k not in previous or previous[k][0] != rec[0]}
+            added = [a for _, a in changes.values()]
+            removed = [a for k, (_, a) in previous.items() if k not in incoming]
+            if added or removed:
+                self._sources[source] = incoming
+                self._resort(source)
+                pending = self._changes.setdefault(source, {})
+                pending.update(changes)
+                pending.update((k, None) for k in previous if k not in incoming)
+                if self._pending is not None:
+                    self._pending["added"].extend(added)
+                    self._pending["removed"].extend(removed)
+        return {"added": added, "removed": removed}
+
+    def take_delta(self) -> dict:
+        """Return and reset everything added / removed since the last call.
+
+        Deltas are only recorded once a consumer has asked for one: the
+        first call starts recording and returns empty lists. At most
+        _DELTA_LIMIT articles of each kind are kept between calls.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = {"added": deque(maxlen=_DELTA_LIMIT),
+                             "removed": deque(maxlen=_DELTA_LIMIT)}
+        if pending is None:
+            return {"added": [], "removed": []}
+        return {kind: list(articles) for kind, articles in pending.items()}
+
+    def source_articles(self, source: str) -> list[Article]:
+        """Articles for one source, newest first."""
+        with self._lock:
+            return self._sorted.get(source, [])
+
+    def version(self, source: str) -> int:
+        """Counter bumped whenever a source's articles change."""
+        with self._lock:
+            return self._versions.get(source, 0)
+
+
+_store: ArticleStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ArticleStore:
+    """Return the process-wide article store, loading it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArticleStore()
+        return _store
@@ -0,0 +1,242 @@
+"""
+Async Fetch Engine
+Runs every RSS/Atom and Hacker News request on a single long-lived asyncio
+event loop thread through one shared httpx.AsyncClient, with a global cap on
+in-flight requests. Refreshes are handed to it from any thread via submit().
+Downloaded feeds are parsed off the loop, in the news_fetcher parse stage.
+Produces the same Articles as the threaded fetchers in news_fetcher.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+import httpx
+
+import feed_cache
+import http_client
+import source_health
+from article_store import Article
+from config import (
+    FETCH_CONCURRENCY,
+    FETCH_HEDGE,
+    FETCH_TIMEOUT,
+    HN_FETCH_CONCURRENCY,
+    HN_ITEM_TIMEOUT,
+    MAX_ARTICLES_PER_SOURCE,
+)
+from news_fetcher import (
+    COMPLETE,
+    FAILED,
+    SKIPPED,
+    _hn_article,
+    _merge_hackernews,
+    _parse_rss,
+)
+
+
+# ── Engine ────────────────────────────────────────────────────────────────────
+
+_engine_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+# Created on first use on the engine loop, and only touched from it.
+_client: httpx.AsyncClient | None = None
+_sem: asyncio.Semaphore | None = None
+
+
+def _engine() -> asyncio.AbstractEventLoop:
+    """The engine's event loop, started in a daemon thread on first use."""
+    global _loop
+    with _engine_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="news-async", daemon=True).start()
+        return _loop
+
+
+def _shared() -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """The engine's HTTP client and in-flight request cap."""
+    global _client, _sem
+    if _client is None:
+        limits = httpx.Limits(
+            max_connections=max(FETCH_CONCURRENCY, 1),
+            max_keepalive_connections=max(FETCH_CONCURRENCY, 1),
+        )
+        _sem = asyncio.Semaphore(max(FETCH_CONCURRENCY, 1))
+        _client = httpx.AsyncClient(
+            timeout=FETCH_TIMEOUT,
+            limits=limits,
+            headers=http_client.DEFAULT_HEADERS,
+            follow_redirects=True,
+        )
+    return _client, _sem
+
+
+async def _get(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    url: str,
+    headers: dict | None = None,
+    timeout: float | None = None,
+) -> httpx.Response:
+    async with sem:
+        if timeout is None:
+            resp = await client.get(url, headers=headers)
+        else:
+            resp = await client.get(url, headers=headers, timeout=timeout)
+    http_client.record_transfer(url, resp.num_bytes_downloaded, len(resp.content))
+    return resp
+
+
+# ── RSS / Atom ────────────────────────────────────────────────────────────────
+
+async def _fetch_rss_async(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    source: dict,
+    timeout: float | None = None,
+) -> list[Article]:
+    url = source["url"]
+    # Feed cache reads and writes touch the disk; keep them off the event loop too.
+    headers = await asyncio.to_thread(feed_cache.conditional_headers, url)
+    resp = await _get(client, sem, url, headers, timeout)
+    if resp.status_code == 304:
+        cached = feed_cache.get_parsed(url)
+        if cached is not None:
+            return cached
+        stored = await asyncio.to_thread(feed_cache.load_body, url)
+        if stored is not None:
+            return await asyncio.to_thread(_parse_rss, source, *stored)
+        resp = await _get(client, sem, url, timeout=timeout)
+    resp.raise_for_status()
+    await asyncio.to_thread(
+        feed_cache.store_response,
+        url, resp.content,
+        resp.headers.get("ETag"),
+        resp.headers.get("Last-Modified"),
+        resp.headers.get("Content-Type"),
+    )
+    # Parsing blocks on the parse pool (or the CPU); keep it off the event loop.
+    return await asyncio.to_thread(_parse_rss, source, resp.content, dict(resp.headers))
+
+
+# ── Hacker News ───────────────────────────────────────────────────────────────
+
+async def _fetch_hackernews_async(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    source: dict,
+    timeout: float | None = None,
+) -> list[Article]:
+    base_url = source["url"]
+    resp = await _get(client, sem, f"{base_url}topstories.json", timeout=timeout)
+    resp.raise_for_status()
+    story_ids = resp.json()[:MAX_ARTICLES_PER_SOURCE]
+    item_timeout = min(HN_ITEM_TIMEOUT, timeout) if timeout else HN_ITEM_TIMEOUT
+
+    item_sem = asyncio.Semaphore(max(HN_FETCH_CONCURRENCY, 1))
+
+    async def _item(sid: int) -> dict | None:
+        try:
+            async with item_sem:
+                r = await asyncio.wait_for(
+                    _get(client, sem, f"{base_url}item/{sid}.json"),
+                    timeout=item_timeout,
+                )
+            r.raise_for_status()
+            return _hn_article(source, r.json())
+        except Exception:
+            return None
+
+    items = await asyncio.gather(*(_item(sid) for sid in story_ids))
+    articles = [a for a in items if a]
+    _merge_hackernews(source, articles)
+    return articles
+
+
+async def _hedged_call_async(fn, client, sem, source: dict, timeout: float) -> list[Article]:
+    """Async counterpart of news_fetcher._hedged_call."""
+    delay = source_health.hedge_delay(source["name"]) if FETCH_HEDGE else None
+    if delay is None:
+        return await fn(client, sem, source, timeout)
+    first = asyncio.ensure_future(fn(client, sem, source, timeout))
+    done, _ = await asyncio.wait({first}, timeout=delay)
+    if done:
+        return first.result()
+    pending = {first, asyncio.ensure_future(fn(client, sem, source, timeout))}
+    error: BaseException | None = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                for loser in pending:
+                    loser.cancel()
+                return task.result()
+            error = task.exception()
+    raise error
+
+
+async def _fetch_source_async(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    source: dict,
+) -> tuple[str, list[Article]]:
+    """Async counterpart of news_fetcher._fetch_source."""
+    name = source["name"]
+    timeout = source_health.begin(name)
+    if timeout is None:
+        return SKIPPED, []
+    fn = _fetch_hackernews_async if source["type"] == "hackernews" else _fetch_rss_async
+    started = time.monotonic()
+    try:
+        batch = await _hedged_call_async(fn, client, sem, source, timeout)
+    except Exception as e:
+        print(f"[WARNING] Failed to fetch {name}: {e or type(e).__name__}")
+        source_health.record_failure(name, str(e) or type(e).__name__)
+        return FAILED, []
+    source_health.record_success(name, time.monotonic() - started)
+    return COMPLETE, batch
+
+
+# ── Entry point ───────────────────────────────────────────────────────────────
+
+async def fetch_sources_async(
+    targets: list[dict],
+    on_source_done: Callable[[str, str, list[Article]], None] | None = None,
+) -> list[Article]:
+    """Fetch all targets concurrently with the engine's shared client.
+
+    Must run on the engine loop; use submit() from other threads.
+    on_source_done(source_name, status, articles) is called as each source
+    finishes, with a status from news_fetcher (COMPLETE, FAILED, SKIPPED).
+    """
+    client, sem = _shared()
+
+    async def _run(src: dict) -> list[Article]:
+        status, batch = await _fetch_source_async(client, sem, src)
+        if on_source_done:
+            on_source_done(src["name"], status, batch)
+        return batch
+
+    results = await asyncio.gather(*(_run(src) for src in targets))
+
+    all_articles: list[Article] = []
+    for batch in results:
+        all_articles.extend(batch)
+    return all_articles
+
+
+def submit(
+    targets: list[dict],
+    on_source_done: Callable[[str, str, list[Article]], None] | None = None,
+) -> Future:
+    """Schedule fetch_sources_async for targets on the engine loop.
+
+    Safe to call from any thread; returns a concurrent.futures.Future for
+    the combined article list.
+    """
+    return asyncio.run_coroutine_threadsafe(
+        fetch_sources_async(targets, on_source_done), _engine(),
+    )
@@ -0,0 +1,115 @@
+"""
+Benchmark and parity check for html_text.clean_html against the previous
+per-entry BeautifulSoup cleaner.
+
+Usage:
+    python benchmarks/bench_clean_html.py [--rounds N]
+
+The corpus is a set of synthetic feed summaries plus the summary/content
+fields of any feeds recorded under benchmarks/fixtures/ (see
+bench_feed_parse.py --record). Exits non-zero if any output differs.
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+
+from html_text import clean_html  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+LIMIT = 3000
+
+_FRAGMENTS = [
+    "<p>Apple unveiled its new headset on Tuesday &mdash; priced at $3,499.</p>",
+    '<p>Read more at <a href="https://example.com/story?id=1&amp;ref=rss">Example</a>.</p>',
+    '<img src="https://cdn.example.com/a.jpg" alt="A photo" width="640" height="480" />',
+    "<figure><img src='x.png'><figcaption>Caption &copy; 2026</figcaption></figure>",
+    "<ul><li>One</li><li>Two &amp; three</li></ul>",
+    "<!-- tracking pixel --><div class=\"ad\">Sponsored</div>",
+    "<script>window.dataLayer = [];</script>",
+    "<style>.x{color:red}</style>",
+    "The company&#8217;s shares rose 5&nbsp;% in after-hours trading.",
+    "<p>  Whitespace\n\n   inside   </p>",
+    "<br/><br />Line<br>break",
+    "<b>Bold</b><i>italic</i><em>em</em>",
+    "<p data-x='1' hidden>Attr</p>",
+    "Caf&eacute; &hellip; &#x1F600;",
+    "<blockquote><p>Quoted text</p></blockquote>",
+    "<h2>Heading</h2><p>" + "Long paragraph text. " * 40 + "</p>",
+]
+
+# Inputs that take the BeautifulSoup fallback; mixed in at a low rate.
+_ODD_FRAGMENTS = [
+    "AT&T and T-Mobile",
+    "x < y but y > z",
+    "<p>Unclosed paragraph <b",
+    "<![CDATA[raw]]>",
+    "&bogus; entity",
+    "<template>hidden</template>",
+]
+
+
+def _reference(raw_html: str) -> str:
+    if not raw_html:
+        return ""
+    soup = BeautifulSoup(raw_html, "html.parser")
+    return soup.get_text(separator=" ", strip=True)[:LIMIT]
+
+
+def _corpus(seed: int = 7, size: int = 2000) -> list[str]:
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(size):
+        parts = rng.choices(_FRAGMENTS, k=rng.randint(1, 12))
+        if rng.random() < 0.05:
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(_ODD_FRAGMENTS))
+        docs.append("".join(parts))
+    docs.extend(_FRAGMENTS + _ODD_FRAGMENTS)
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.xml"))):
+        with open(path, "rb") as f:
+            feed = feedparser.parse(f.read())
+        for entry in feed.entries:
+            docs.append(entry.get("summary", ""))
+            if entry.get("content"):
+                docs.append(entry.content[0].get("value", ""))
+    return docs
+
+
+def _time(fn, docs: list[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for d in docs:
+            fn(d)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    docs = _corpus()
+    mismatches = [d for d in docs if clean_html(d, LIMIT) != _reference(d)]
+    print(f"parity: {len(docs) - len(mismatches)}/{len(docs)} documents identical")
+    for d in mismatches[:5]:
+        print(f"  MISMATCH: {d[:120]!r}")
+        print(f"    fast: {clean_html(d, LIMIT)[:120]!r}")
+        print(f"    bs4:  {_reference(d)[:120]!r}")
+
+    bs4_s = _time(_reference, docs, args.rounds)
+    fast_s = _time(lambda d: clean_html(d, LIMIT), docs, args.rounds)
+    print(f"BeautifulSoup: {bs4_s:.3f}s   clean_html: {fast_s:.3f}s   "
+          f"speedup: {bs4_s / fast_s:.1f}x  ({len(docs)} docs x {args.rounds} rounds)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
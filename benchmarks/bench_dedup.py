@@ -0,0 +1,148 @@
+"""
+Benchmark and parity check for dedup.DedupIndex against the original
+pairwise title loop.
+
+Usage:
+    python benchmarks/bench_dedup.py [--titles N] [--parity N] [--vocab N] [--head N] [--budget S]
+
+Headlines are synthetic: 5-14 words drawn from a Zipf-like vocabulary of
+--vocab words (weight 1 / (rank + --head); a small --head gives a heavy
+head of very common words), with stopwords sprinkled in and 20% of titles
+perturbed copies of earlier ones (a word dropped, added or replaced, or
+the title cut to two thirds). Two parity sets are compared with the old
+loop: --parity such headlines, and headline pairs where the second is the
+first half of the first (the containment case the overlap rule divides
+by the shorter title for). Exits non-zero if any kept set differs, or if
+keys plus index for --titles headlines take longer than --budget seconds.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from itertools import accumulate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DEDUP_THRESHOLD  # noqa: E402
+from dedup import DedupIndex  # noqa: E402
+
+_STOPWORDS = ["the", "a", "to", "of", "in", "for", "and", "on", "with", "is"]
+
+
+class _Headlines:
+    def __init__(self, vocab: int, head: int, seed: int = 1):
+        self.rng = random.Random(seed)
+        self.words = [f"w{i}" for i in range(vocab)]
+        self.cum = list(accumulate(1 / (i + head) for i in range(vocab)))
+
+    def title(self) -> str:
+        rng = self.rng
+        words = rng.choices(self.words, cum_weights=self.cum, k=rng.randint(5, 14))
+        for _ in range(rng.randint(1, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(_STOPWORDS))
+        return " ".join(words)
+
+    def perturb(self, title: str) -> str:
+        rng = self.rng
+        words = title.split()
+        op = rng.random()
+        if op < 0.3 and len(words) > 4:
+            words.pop(rng.randrange(len(words)))
+        elif op < 0.6:
+            words.insert(rng.randrange(len(words)), rng.choice(self.words[:2000]))
+        elif op < 0.8:
+            words[rng.randrange(len(words))] = rng.choices(self.words, cum_weights=self.cum)[0]
+        else:
+            words = words[:max(3, len(words) * 2 // 3)]
+        return " ".join(words)
+
+    def batch(self, n: int) -> list[dict]:
+        articles: list[dict] = []
+        for i in range(n):
+            if articles and self.rng.random() < 0.2:
+                title = self.perturb(self.rng.choice(articles)["title"])
+            else:
+                title = self.title()
+            articles.append({"title": title, "url": f"https://example.com/{i}"})
+        return articles
+
+    def contained(self, n: int) -> list[dict]:
+        articles = []
+        for i in range(n):
+            title = self.title()
+            words = title.split()
+            articles.append({"title": title, "url": f"https://example.com/{i}/full"})
+            articles.append({"title": " ".join(words[:max(1, len(words) // 2)]),
+                             "url": f"https://example.com/{i}/half"})
+        return articles
+
+
+def _old_dedup(articles: list[dict]) -> list[dict]:
+    """The pairwise loop dedup.DedupIndex replaced, verbatim apart from names."""
+    seen: set[str] = set()
+    unique: list[dict] = []
+    for a in articles:
+        norm = re.sub(r"[^a-z0-9 ]", "", a["title"].lower()).strip()
+        is_dup = False
+        for s in seen:
+            words_a = set(norm.split())
+            words_s = set(s.split())
+            if not words_a or not words_s:
+                continue
+            overlap = len(words_a & words_s) / min(len(words_a), len(words_s))
+            if overlap > DEDUP_THRESHOLD:
+                is_dup = True
+                break
+        if not is_dup:
+            seen.add(norm)
+            unique.append(a)
+    return unique
+
+
+def _parity(name: str, articles: list[dict]) -> bool:
+    start = time.perf_counter()
+    old = {a["url"] for a in _old_dedup(articles)}
+    old_s = time.perf_counter() - start
+    start = time.perf_counter()
+    new = {a["url"] for a in DedupIndex().filter(articles)}
+    new_s = time.perf_counter() - start
+    same = old == new
+    print(f"{name:<14}{len(articles):>8,}{len(old):>8,}{len(new):>8,}"
+          f"{old_s:>9.2f}s{new_s:>9.3f}s  {'ok' if same else f'DIFFERS ({len(old ^ new)})'}")
+    return same
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titles", type=int, default=50000)
+    parser.add_argument("--parity", type=int, default=3000)
+    parser.add_argument("--vocab", type=int, default=20000)
+    parser.add_argument("--head", type=int, default=20)
+    parser.add_argument("--budget", type=float, default=1.0)
+    args = parser.parse_args()
+
+    gen = _Headlines(args.vocab, args.head)
+    print(f"threshold {DEDUP_THRESHOLD}, vocabulary {args.vocab:,}, head {args.head}\n")
+    print(f"{'parity':<14}{'titles':>8}{'old':>8}{'new':>8}{'old loop':>10}{'index':>10}")
+    ok = _parity("headlines", gen.batch(args.parity))
+    ok &= _parity("contained", gen.contained(args.parity // 2))
+
+    articles = gen.batch(args.titles)
+    start = time.perf_counter()
+    keys = DedupIndex().prepare(articles)
+    prepare_s = time.perf_counter() - start
+    start = time.perf_counter()
+    kept = DedupIndex().filter(articles, keys)
+    filter_s = time.perf_counter() - start
+    print(f"\n{len(articles):,} titles, kept {len(kept):,}: keys {prepare_s:.3f}s "
+          f"+ index {filter_s:.3f}s ({(prepare_s + filter_s) / len(articles) * 1e6:.1f} us/title)")
+    within = prepare_s + filter_s <= args.budget
+    print(f"budget {args.budget:.2f}s: {'ok' if within else 'OVER'}")
+    return 0 if ok and within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
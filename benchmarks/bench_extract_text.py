@@ -0,0 +1,106 @@
+"""
+Check and benchmark for html_text.extract_main_text against the previous
+BeautifulSoup page extractor.
+
+Usage:
+    python benchmarks/bench_extract_text.py [--rounds N]
+
+Each synthetic page has known article paragraphs and known boilerplate
+(menus, link lists, scripts). The check passes when every paragraph is in
+the extracted text and no boilerplate is; layouts include a plain article,
+a link-heavy portal page, and a page whose whole body sits inside one
+<form>, as ASP.NET WebForms renders it. Exits non-zero if any check fails.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from html_text import extract_main_text  # noqa: E402
+
+LIMIT = 4000
+
+_PARAGRAPHS = [
+    "The chipmaker reported quarterly revenue of 12 billion dollars, ahead of analyst estimates.",
+    "Demand for data center accelerators drove most of the growth, the company said on Tuesday.",
+    "Executives expect supply constraints to ease in the second half of the year as new fabs open.",
+]
+_BOILERPLATE = ["Home", "Subscribe now", "trackingPixel", "Related: Ten gadgets", "Sign in"]
+
+_NAV = (
+    "<header><a href='/'>Home</a> <a href='/login'>Sign in</a></header>"
+    "<nav><ul><li><a href='/a'>World</a></li><li><a href='/b'>Tech</a></li></ul></nav>"
+)
+_RELATED = "<aside><a href='/r'>Related: Ten gadgets you missed this week</a></aside>"
+_SCRIPT = "<script>var trackingPixel = 1;</script>"
+_FOOTER = "<footer><a href='/s'>Subscribe now</a></footer>"
+
+
+def _article() -> str:
+    return "<article><h1>Chip earnings</h1>" + "".join(f"<p>{p}</p>" for p in _PARAGRAPHS) + "</article>"
+
+
+def _pages() -> dict[str, str]:
+    portal_links = "".join(f"<li><a href='/s{i}'>Story headline number {i}</a></li>" for i in range(40))
+    return {
+        "article": f"<html><body>{_NAV}{_article()}{_RELATED}{_SCRIPT}{_FOOTER}</body></html>",
+        "portal": (f"<html><body>{_NAV}<div><ul>{portal_links}</ul></div>{_article()}"
+                   f"{_RELATED}{_FOOTER}</body></html>"),
+        "webforms": (
+            "<html><body><form name='aspnetForm' method='post' id='aspnetForm'>"
+            "<input type='hidden' name='__VIEWSTATE' value='abc' />"
+            f"{_NAV}<div id='content'>{_article()}</div>{_RELATED}{_SCRIPT}"
+            "<button type='submit'>Search</button>"
+            f"{_FOOTER}</form></body></html>"
+        ),
+    }
+
+
+def _reference(page_html: str) -> str:
+    soup = BeautifulSoup(page_html, "html.parser")
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside", "iframe"]):
+        tag.decompose()
+    return soup.get_text(separator=" ", strip=True)[:LIMIT]
+
+
+def _check(name: str, text: str) -> bool:
+    missing = [p for p in _PARAGRAPHS if p not in text]
+    leaked = [b for b in _BOILERPLATE if b in text]
+    ok = not missing and not leaked
+    print(f"  {name:<10} {'ok' if ok else 'FAILED'}"
+          + (f"  missing {len(missing)} paragraphs" if missing else "")
+          + (f"  leaked {leaked}" if leaked else ""))
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    pages = _pages()
+    print("extract_main_text:")
+    ok = all([_check(name, extract_main_text(page, LIMIT)) for name, page in pages.items()])
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for page in pages.values():
+            _reference(page)
+    old_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for page in pages.values():
+            extract_main_text(page, LIMIT)
+    new_s = time.perf_counter() - start
+    print(f"BeautifulSoup: {old_s:.3f}s   extract_main_text: {new_s:.3f}s   "
+          f"({len(pages)} pages x {args.rounds} rounds)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
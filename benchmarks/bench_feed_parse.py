@@ -0,0 +1,184 @@
+"""
+Benchmark and parity check for feed_parser.parse_entries against feedparser.
+
+Usage:
+    python benchmarks/bench_feed_parse.py --record   # save the configured feeds
+    python benchmarks/bench_feed_parse.py [--rounds N] [--limit N]
+
+--record downloads every RSS/Atom source in config.NEWS_SOURCES to
+benchmarks/fixtures/<name>.xml. Without recorded fixtures, a synthetic copy
+of each feed is generated instead (RSS 2.0 with content:encoded, or Atom,
+100 full-content entries each), and the report says so. Exits non-zero if
+any parsed article differs between the two paths.
+"""
+
+import argparse
+import glob
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feed_parser  # noqa: E402
+import http_client  # noqa: E402
+from config import MAX_ARTICLES_PER_SOURCE, NEWS_SOURCES  # noqa: E402
+from news_fetcher import _clean_html, _feedparser_entries  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def record() -> int:
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    failures = 0
+    for src in NEWS_SOURCES:
+        if src["type"] != "rss":
+            continue
+        path = os.path.join(FIXTURES_DIR, f"{_slug(src['name'])}.xml")
+        try:
+            resp = http_client.get(src["url"])
+            resp.raise_for_status()
+        except Exception as e:
+            print(f"  {src['name']}: FAILED ({e})")
+            failures += 1
+            continue
+        with open(path, "wb") as f:
+            f.write(resp.content)
+        print(f"  {src['name']}: {len(resp.content):,} bytes -> {os.path.relpath(path)}")
+    return 1 if failures else 0
+
+
+# ── Synthetic stand-ins ───────────────────────────────────────────────────────
+
+_WORDS = ("chip model launch cloud startup funding security breach open source "
+          "developer platform device battery display network update release").split()
+
+
+def _paragraphs(rng: random.Random, n: int) -> str:
+    return "".join(
+        f"<p>{' '.join(rng.choices(_WORDS, k=60)).capitalize()} &amp; more. "
+        f'<a href="https://example.com/{rng.randrange(999)}">Link</a></p>'
+        for _ in range(n)
+    )
+
+
+def _synthetic(name: str, atom: bool, entries: int = 100) -> bytes:
+    rng = random.Random(name)
+    now = datetime(2026, 3, 3, 12, 0, tzinfo=timezone.utc)
+    items = []
+    for i in range(entries):
+        title = escape(" ".join(rng.choices(_WORDS, k=8)).title())
+        url = f"https://{_slug(name)}.example.com/2026/03/{i}/story-{i}"
+        when = now - timedelta(minutes=37 * i)
+        summary = escape(_paragraphs(rng, 1))
+        content = _paragraphs(rng, rng.randint(8, 20))
+        if atom:
+            items.append(
+                f'<entry><title type="html">{title}</title>'
+                f'<link rel="alternate" type="text/html" href="{url}"/>'
+                f"<id>{url}</id><published>{when.isoformat()}</published>"
+                f"<updated>{when.isoformat()}</updated>"
+                f'<summary type="html">{summary}</summary>'
+                f'<content type="html">{escape(content)}</content></entry>'
+            )
+        else:
+            items.append(
+                f"<item><title>{title}</title><link>{url}</link>"
+                f"<pubDate>{format_datetime(when)}</pubDate>"
+                f'<guid isPermaLink="false">{url}</guid>'
+                f"<description>{summary}</description>"
+                f"<content:encoded><![CDATA[{content}]]></content:encoded></item>"
+            )
+    if atom:
+        doc = ('<?xml version="1.0" encoding="utf-8"?>'
+               f'<feed xmlns="http://www.w3.org/2005/Atom"><title>{name}</title>'
+               + "".join(items) + "</feed>")
+    else:
+        doc = ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0" '
+               'xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+               f"<channel><title>{name}</title>" + "".join(items) + "</channel></rss>")
+    return doc.encode("utf-8")
+
+
+def _load_feeds() -> tuple[dict[str, bytes], bool]:
+    paths = sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.xml")))
+    if paths:
+        feeds = {}
+        for path in paths:
+            with open(path, "rb") as f:
+                feeds[os.path.basename(path)[:-4]] = f.read()
+        return feeds, True
+    rss_sources = [s for s in NEWS_SOURCES if s["type"] == "rss"]
+    return {
+        _slug(s["name"]): _synthetic(s["name"], atom=i % 3 == 1)
+        for i, s in enumerate(rss_sources)
+    }, False
+
+
+# ── Comparison ────────────────────────────────────────────────────────────────
+
+def _articles(entries: list[dict]) -> list[tuple]:
+    return [
+        (e["title"] or "Untitled", e["link"], _clean_html(e["summary"]),
+         _clean_html(e["content"]), e["published"])
+        for e in entries
+    ]
+
+
+def _time(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--record", action="store_true", help="download the configured feeds")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=MAX_ARTICLES_PER_SOURCE)
+    args = parser.parse_args()
+
+    if args.record:
+        return record()
+
+    feeds, recorded = _load_feeds()
+    print(f"{'recorded' if recorded else 'synthetic'} feeds: {len(feeds)}, "
+          f"first {args.limit} entries, {args.rounds} rounds\n")
+    print(f"{'feed':<28}{'size':>10}{'feedparser':>13}{'incremental':>13}{'speedup':>9}  parity")
+
+    mismatched = 0
+    total_ref = total_fast = 0.0
+    for name, body in feeds.items():
+        fast = feed_parser.parse_entries(body, args.limit)
+        ref = _feedparser_entries(body, {}, args.limit)
+        if fast is None:
+            parity = "fallback"
+            fast_s = ref_s = _time(lambda: _feedparser_entries(body, {}, args.limit), args.rounds)
+        else:
+            same = _articles(fast) == _articles(ref)
+            mismatched += not same
+            parity = "ok" if same else "DIFFERS"
+            ref_s = _time(lambda: _feedparser_entries(body, {}, args.limit), args.rounds)
+            fast_s = _time(lambda: feed_parser.parse_entries(body, args.limit), args.rounds)
+        total_ref += ref_s
+        total_fast += fast_s
+        print(f"{name:<28}{len(body):>10,}{ref_s * 1000:>11.2f}ms{fast_s * 1000:>11.2f}ms"
+              f"{ref_s / fast_s:>8.1f}x  {parity}")
+
+    print(f"\n{'total':<38}{total_ref * 1000:>11.2f}ms{total_fast * 1000:>11.2f}ms"
+          f"{total_ref / total_fast:>8.1f}x")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
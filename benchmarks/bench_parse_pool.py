@@ -0,0 +1,65 @@
+"""
+Benchmark for the feed parse stage: worker threads vs. worker processes.
+
+Usage:
+    python benchmarks/bench_parse_pool.py [--sources N] [--workers 1,2,4]
+
+Parses and cleans --sources feed bodies (the recorded fixtures from
+bench_feed_parse.py --record, else synthetic feeds, repeated to reach N)
+with news_fetcher._parse_records, first on N threads and then on a process
+pool of the same size, and reports feeds per second for each. Threads share
+the GIL, so only the process pool should scale with cores.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import cycle, islice
+from multiprocessing import get_context
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_feed_parse import _load_feeds  # noqa: E402
+from news_fetcher import _parse_records  # noqa: E402
+
+
+def _parse(body: bytes) -> int:
+    return len(_parse_records(body, {}, {}))
+
+
+def _run(pool, bodies: list[bytes]) -> float:
+    start = time.perf_counter()
+    entries = sum(pool.map(_parse, bodies))
+    elapsed = time.perf_counter() - start
+    assert entries > 0
+    return len(bodies) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sources", type=int, default=200)
+    parser.add_argument("--workers", default=",".join(
+        str(n) for n in sorted({1, 2, 4, os.cpu_count() or 1})
+    ))
+    args = parser.parse_args()
+
+    feeds, recorded = _load_feeds()
+    bodies = list(islice(cycle(feeds.values()), args.sources))
+    print(f"{'recorded' if recorded else 'synthetic'} feeds, {len(bodies)} sources, "
+          f"{os.cpu_count()} cores\n")
+    print(f"{'workers':>8}{'threads':>14}{'processes':>14}{'speedup':>9}")
+
+    for n in (int(w) for w in args.workers.split(",")):
+        with ThreadPoolExecutor(n) as pool:
+            threaded = _run(pool, bodies)
+        with ProcessPoolExecutor(n, mp_context=get_context("spawn")) as pool:
+            pool.submit(_parse, bodies[0]).result()  # start the workers first
+            processes = _run(pool, bodies)
+        print(f"{n:>8}{threaded:>10.1f}/s{processes:>12.1f}/s{processes / threaded:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,8 +21,66 @@ DIGEST_RECIPIENT = os.getenv("DIGEST_RECIPIENT", "")
 MAX_ARTICLES_PER_SOURCE = int(os.getenv("MAX_ARTICLES_PER_SOURCE", "8"))
 SUMMARY_MAX_TOKENS = int(os.getenv("SUMMARY_MAX_TOKENS", "400"))
 FETCH_TIMEOUT = int(os.getenv("FETCH_TIMEOUT", "15"))
+# "threads" (pool of source worker threads) or "asyncio" (single event loop)
+FETCH_MODE = os.getenv("FETCH_MODE", "threads").lower()
+# Worker threads that fetch sources; further fetches wait in a priority queue
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", "32"))
+# Max in-flight HTTP requests across all sources in asyncio mode
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "20"))
+# Concurrent Hacker News item requests and the deadline (seconds) for each one
+HN_FETCH_CONCURRENCY = int(os.getenv("HN_FETCH_CONCURRENCY", "16"))
+HN_ITEM_TIMEOUT = float(os.getenv("HN_ITEM_TIMEOUT", "5"))
+# Processes that parse and clean downloaded feeds (0 parses in the fetching threads)
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(min(8, (os.cpu_count() or 1) - 1))))
+# Titles sharing more than this fraction of words (of the shorter title) are duplicates
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.7"))
+# Stop reading an article page after this many bytes when extracting its text
+ARTICLE_MAX_BYTES = int(os.getenv("ARTICLE_MAX_BYTES", "524288"))
+# Per-source timeout = observed p95 latency x factor, clamped to [MIN_FETCH_TIMEOUT, FETCH_TIMEOUT]
+TIMEOUT_P95_FACTOR = float(os.getenv("TIMEOUT_P95_FACTOR", "2.0"))
+MIN_FETCH_TIMEOUT = float(os.getenv("MIN_FETCH_TIMEOUT", "2"))
+# Consecutive failures that open a source's circuit, and seconds before it is probed again
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+CIRCUIT_COOLDOWN = int(os.getenv("CIRCUIT_COOLDOWN", "300"))
+# Race a second attempt when a source runs past its p95 latency
+FETCH_HEDGE = os.getenv("FETCH_HEDGE", "true").lower() in ("1", "true", "yes")
+# Page-load budget (seconds) for the dashboard; slower sources finish in the background
+FETCH_DEADLINE = float(os.getenv("FETCH_DEADLINE", "8"))
+# Background refresh: default interval per source (seconds; a source's own
+# "refresh_seconds" wins), +/- jitter fraction, and the cap on failure backoff
+REFRESH_SECONDS = int(os.getenv("REFRESH_SECONDS", "600"))
+REFRESH_JITTER = float(os.getenv("REFRESH_JITTER", "0.1"))
+REFRESH_MAX_BACKOFF = int(os.getenv("REFRESH_MAX_BACKOFF", "3600"))
+# On-disk LRU cache of extracted article text: size bound (MB) and lifetime (seconds)
+BODY_CACHE_MAX_MB = int(os.getenv("BODY_CACHE_MAX_MB", "64"))
+BODY_CACHE_TTL = int(os.getenv("BODY_CACHE_TTL", "86400"))
+# Cache of Google News search results for chat: size bound (MB) and lifetime (seconds)
+WEB_SEARCH_CACHE_MAX_MB = int(os.getenv("WEB_SEARCH_CACHE_MAX_MB", "8"))
+WEB_SEARCH_CACHE_TTL = int(os.getenv("WEB_SEARCH_CACHE_TTL", "900"))
+# Persistent cache of OpenAI completions: size bound (MB) and lifetime (seconds)
+LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "64"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "86400"))
+# Sentiment: headlines per classification request, requests in parallel, and
+# retries for a request whose reply cannot be parsed
+SENTIMENT_SHARD_SIZE = int(os.getenv("SENTIMENT_SHARD_SIZE", "25"))
+SENTIMENT_CONCURRENCY = int(os.getenv("SENTIMENT_CONCURRENCY", "8"))
+SENTIMENT_RETRIES = int(os.getenv("SENTIMENT_RETRIES", "1"))
+# Stored sentiment per article: size bound (MB) and lifetime (seconds, 0 = until evicted)
+SENTIMENT_CACHE_MAX_MB = int(os.getenv("SENTIMENT_CACHE_MAX_MB", "8"))
+SENTIMENT_CACHE_TTL = int(os.getenv("SENTIMENT_CACHE_TTL", "0"))
+# Background summaries after each refresh: how many top stories, and how many at once
+PRESUMMARIZE_TOP_N = int(os.getenv("PRESUMMARIZE_TOP_N", "20"))
+PRESUMMARIZE_CONCURRENCY = int(os.getenv("PRESUMMARIZE_CONCURRENCY", "4"))
+# Stored article summaries: size bound (MB) and lifetime (seconds)
+SUMMARY_CACHE_MAX_MB = int(os.getenv("SUMMARY_CACHE_MAX_MB", "16"))
+SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", "172800"))
 
 # ── News Sources ──────────────────────────────────────────────────────────────
+# Optional OPML / JSON / YAML file of sources; replaces NEWS_SOURCES when set
+SOURCES_FILE = os.getenv("SOURCES_FILE", "")
+# Sources are split into this many shards for refresh progress reporting
+SOURCE_SHARDS = int(os.getenv("SOURCE_SHARDS", "16"))
+
 NEWS_SOURCES = [
     {
         "name": "TechCrunch",
@@ -58,6 +116,7 @@ NEWS_SOURCES = [
         "url": "https://hacker-news.firebaseio.com/v0/",
         "category": "Developer & Startups",
         "domain": "news.ycombinator.com",
+        "refresh_seconds": 300,
     },
     {
         "name": "MIT Technology Review",
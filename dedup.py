@@ -0,0 +1,210 @@
+"""
+Dedup Engine — Near-duplicate detection with an exact candidate search.
+Canonical-URL and exact-title lookups catch the common cases in O(1); two
+inverted word indexes narrow everything else down to the few titles that
+can possibly pass the word-overlap rule, which are then checked exactly.
+"""
+
+import re
+from collections import defaultdict
+
+from article_store import canonical_url
+from config import DEDUP_THRESHOLD
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, strip punctuation for dedup comparison."""
+    return re.sub(r"[^a-z0-9 ]", "", title.lower()).strip()
+
+
+def _hits(lists) -> tuple[set[int], set[int]]:
+    """Titles appearing in at least one, and in at least two, of the lists."""
+    once: set[int] = set()
+    twice: set[int] = set()
+    for ids in lists:
+        if ids:
+            if once:
+                twice.update(once.intersection(ids))
+                once.update(ids)
+            else:
+                once = set(ids)
+    return once, twice
+
+
+class DedupIndex:
+    """Incremental near-duplicate index over article titles.
+
+    An article is a duplicate of a kept one when their canonical URLs match,
+    their normalized titles are identical, or their title word sets overlap
+    by more than `threshold` (shared words / smaller set), which is the rule
+    the original pairwise loop used.
+
+    Candidates are found by prefix filtering, which never misses a match:
+    if titles A and B share at least k words, any len - k + 2 words of
+    either one include at least two shared words. Every word of every
+    kept title is indexed, and probed with the new title's rarest words
+    (covers B at least as long as A); each kept title's rarest words are
+    indexed separately, and probed with all of the new title's words
+    (covers B shorter than A). Picking the rarest words keeps the lists
+    short.
+    """
+
+    def __init__(self, threshold: float = DEDUP_THRESHOLD):
+        self.threshold = threshold
+        # Kept articles are numbered in order; these map back to that number.
+        self._kept = 0
+        self._urls: dict[str, int] = {}
+        self._titles: dict[str, int] = {}
+        self._words: list[frozenset[str]] = []
+        self._word_owner: list[int] = []
+        # word -> indexed titles, for every word / for each title's rarest words
+        self._postings: dict[str, list[int]] = {}
+        self._prefixes: dict[str, list[int]] = {}
+        # Indexed titles too short to need two prefix hits (one-word titles).
+        self._one_hit: set[int] = set()
+        # Kept titles containing each word; words only probed so far count 0.
+        self._df: defaultdict[str, int] = defaultdict(int)
+        # Per title length: (shared words needed, prefix size, prefix hits needed).
+        self._plans: list[tuple[int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _plan(self, n: int) -> tuple[int, int, int]:
+        """For an n-word title: the fewest shared words that make it a duplicate
+        of a longer title, how many of its rarest words to index or probe, and
+        how many of those (1 or 2) a duplicate must contain."""
+        plans = self._plans
+        while len(plans) <= n:
+            m = len(plans)
+            # The same division as the match test, so float rounding agrees.
+            need = max(0, int(self.threshold * m) - 1)
+            while need <= m and not (m and need / m > self.threshold):
+                need += 1
+            size = min(m, m - need + 2)
+            plans.append((need, size, need - (m - size)))
+        return plans[n]
+
+    def _near_duplicate(self, words: frozenset[str], ranked: list[str]) -> int | None:
+        n = len(words)
+        need, size, hits_needed = self._plan(n)
+        if need > n:
+            return None
+        once, twice = _hits(map(self._postings.get, ranked[:size]))
+        candidates = twice if hits_needed > 1 else once
+        once, twice = _hits(map(self._prefixes.get, words))
+        candidates |= twice
+        if self._one_hit:
+            candidates |= once & self._one_hit
+        threshold = self.threshold
+        for idx in sorted(candidates):
+            other = self._words[idx]
+            if len(words & other) / min(n, len(other)) > threshold:
+                return self._word_owner[idx]
+        return None
+
+    def _find(self, url: str, norm: str, words: frozenset[str], ranked: list[str]) -> int | None:
+        """Number of the kept article this one duplicates, or None."""
+        if url and url in self._urls:
+            return self._urls[url]
+        if norm and norm in self._titles:
+            return self._titles[norm]
+        if words:
+            return self._near_duplicate(words, ranked)
+        return None
+
+    def _insert(self, url: str, norm: str, words: frozenset[str], ranked: list[str]) -> int:
+        kept = self._kept
+        self._kept += 1
+        if url:
+            self._urls[url] = kept
+        if norm:
+            self._titles[norm] = kept
+        if words:
+            idx = len(self._words)
+            self._words.append(words)
+            self._word_owner.append(kept)
+            need, size, hits_needed = self._plan(len(words))
+            if hits_needed < 2:
+                self._one_hit.add(idx)
+            if need <= len(words):
+                prefixes = self._prefixes
+                for w in ranked[:size]:
+                    ids = prefixes.get(w)
+                    if ids is None:
+                        prefixes[w] = [idx]
+                    else:
+                        ids.append(idx)
+            postings, df = self._postings, self._df
+            for w in words:
+                ids = postings.get(w)
+                if ids is None:
+                    postings[w] = [idx]
+                else:
+                    ids.append(idx)
+                df[w] += 1
+        return kept
+
+    def _lookup(self, key: tuple) -> tuple:
+        url, norm, words = key
+        return url, norm, words, sorted(words, key=self._df.__getitem__)
+
+    def _add(self, key: tuple) -> bool:
+        key = self._lookup(key)
+        if self._find(*key) is not None:
+            return False
+        self._insert(*key)
+        return True
+
+    def add(self, article: dict) -> bool:
+        """Index an article unless it duplicates one already kept.
+
+        Returns True if the article was kept, False if it is a duplicate.
+        """
+        return self._add(self.prepare([article])[0])
+
+    def prepare(self, articles: list[dict]) -> list[tuple]:
+        """Compute dedup keys for a batch.
+
+        Returns one opaque key tuple per article. Keys depend only on the
+        article, so they can be cached per article and passed to filter()
+        on any index.
+        """
+        keys = []
+        for article in articles:
+            norm = normalize_title(article.get("title", ""))
+            keys.append((canonical_url(article.get("url", "")), norm, frozenset(norm.split())))
+        return keys
+
+    def filter(self, articles: list[dict], prepared: list[tuple] | None = None) -> list[dict]:
+        """Add a batch in order and return the articles that were kept.
+
+        prepared, if given, is the output of prepare() for these articles.
+        """
+        if prepared is None:
+            prepared = self.prepare(articles)
+        kept: list[dict] = []
+        for article, key in zip(articles, prepared):
+            if self._add(key):
+                kept.append(article)
+        return kept
+
+    def cluster(self, articles: list[dict], prepared: list[tuple] | None = None) -> list[int]:
+        """Add a batch in order and say which story each article belongs to.
+
+        Returns, per article, the position in `articles` of the first article
+        of its duplicate group (its own position if it was kept). Articles
+        matching something indexed before this batch get -1.
+        """
+        if prepared is None:
+            prepared = self.prepare(articles)
+        first: dict[int, int] = {}
+        groups: list[int] = []
+        for i, key in enumerate(prepared):
+            key = self._lookup(key)
+            kept = self._find(*key)
+            if kept is None:
+                kept = self._insert(*key)
+                first[kept] = i
+            groups.append(first.get(kept, -1))
+        return groups
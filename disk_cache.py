@@ -0,0 +1,145 @@
+"""
+Disk Cache — Size-bounded, persistent LRU key/value cache on SQLite.
+Entries expire after a TTL; when the total size exceeds the bound, the least
+recently used entries are evicted. Values are stored as JSON. Safe to share
+between threads and between Streamlit sessions in one process.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key      TEXT PRIMARY KEY,
+    value    TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    created  REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+class DiskCache:
+    """LRU cache of JSON-serializable values in one SQLite file.
+
+    max_bytes bounds the summed size of the stored JSON; ttl (seconds) is
+    the age after which an entry counts as a miss. A ttl of 0 disables
+    expiry. Counters for hits, misses and evictions are kept per process.
+    """
+
+    def __init__(self, name: str, max_bytes: int, ttl: float = 0):
+        self.path = os.path.join(CACHE_DIR, f"{name}.sqlite3")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # Summed size of all entries, read once on open and kept up to date
+        # by set / delete / eviction so writes don't re-scan the table.
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str, default=None):
+        """Return the cached value for key, or default if missing or expired."""
+        now = time.time()
+        with self._lock:
+            try:
+                db = self._db()
+                row = db.execute(
+                    "SELECT value, created, size FROM entries WHERE key = ?", (key,),
+                ).fetchone()
+                if row is not None and self.ttl and now - row[1] > self.ttl:
+                    db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._bytes -= row[2]
+                    row = None
+                if row is None:
+                    self._stats["misses"] += 1
+                    return default
+                db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+                self._stats["hits"] += 1
+            except Exception as e:
+                print(f"[WARNING] Cache read failed ({os.path.basename(self.path)}): {e}")
+                self._stats["misses"] += 1
+                return default
+        return json.loads(row[0])
+
+    def set(self, key: str, value) -> None:
+        """Store value under key and evict least recently used entries if over size."""
+        data = json.dumps(value, ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                db = self._db()
+                old = db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                db.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, data, size, now, now),
+                )
+                self._stats["writes"] += 1
+                self._bytes += size - (old[0] if old else 0)
+                if self._bytes > self.max_bytes:
+                    self._evict(db)
+            except Exception as e:
+                print(f"[WARNING] Cache write failed ({os.path.basename(self.path)}): {e}")
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        # Re-read the real total before evicting, in case another connection
+        # to the same file changed it.
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self._bytes = total
+        if total <= self.max_bytes:
+            return
+        # Walk entries oldest-access first until enough bytes are freed.
+        excess = total - self.max_bytes
+        victims: list[str] = []
+        for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            victims.append(key)
+            excess -= size
+            self._bytes -= size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in victims])
+        self._stats["evictions"] += len(victims)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            try:
+                db = self._db()
+                row = db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._bytes -= row[0]
+            except Exception:
+                pass
+
+    def stats(self) -> dict:
+        """Return {hits, misses, writes, evictions, entries, bytes}."""
+        with self._lock:
+            out = dict(self._stats)
+            try:
+                entries = self._db().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            except Exception:
+                entries = 0
+            size = self._bytes
+        out.update(entries=entries, bytes=size)
+        return out
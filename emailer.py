@@ -51,13 +51,22 @@ def get_last_send_info() -> dict | None:
     }
 
 
+def previously_sent_ids() -> set[str]:
+    """IDs of articles included in any logged digest."""
+    return {
+        aid
+        for entry in get_send_history()
+        for aid in entry.get("article_ids", [])
+    }
+
+
 def get_send_history() -> list[dict]:
     """Return the list of past email sends (newest first)."""
     log = _load_email_log()
     return log.get("history", [])
 
 
-def _mark_sent_today(recipient: str, article_count: int) -> None:
+def _mark_sent_today(recipient: str, article_count: int, article_ids: list[str]) -> None:
     log = _load_email_log()
     log["last_sent_date"] = date.today().isoformat()
     log["last_sent_time"] = datetime.now(timezone.utc).isoformat()
@@ -69,6 +78,7 @@ def _mark_sent_today(recipient: str, article_count: int) -> None:
         "time": datetime.now(timezone.utc).isoformat(),
         "recipient": recipient,
         "article_count": article_count,
+        "article_ids": article_ids,
     })
     log["history"] = history[:30]
     _save_email_log(log)
@@ -203,6 +213,10 @@ def send_news_digest(
     if not articles:
         return False, "No articles to include in the digest."
 
+    # Stories already mailed in an earlier digest go after the new ones.
+    sent_before = previously_sent_ids()
+    articles = sorted(articles, key=lambda a: a.get("id") in sent_before)
+
     html = _build_html_email(articles, trending_topics or [])
     today_str = datetime.now(timezone.utc).strftime("%b %d, %Y")
 
@@ -222,7 +236,10 @@ def send_news_digest(
             server.starttls()
             server.login(smtp_email, smtp_password)
             server.send_message(msg)
-        _mark_sent_today(recipient, len(articles))
+        _mark_sent_today(
+            recipient, len(articles),
+            [a["id"] for a in articles[:15] if a.get("id")],
+        )
         return True, f"Digest sent to **{recipient}** with {len(articles)} articles!"
     except smtplib.SMTPAuthenticationError:
         return (
@@ -0,0 +1,139 @@
+"""
+Feed Cache — On-disk HTTP cache for RSS/Atom feeds.
+Keeps the raw body, ETag and Last-Modified for every feed URL so refreshes can
+send conditional requests and reuse the previously parsed entries on a 304.
+Each feed's validators sit in a small JSON file next to its body, so a fresh
+response rewrites only that feed's two files.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from article_store import Article
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "feed_cache")
+
+_lock = threading.Lock()
+# Validators per feed URL, as read from or written to its .json sidecar.
+_meta: dict[str, dict] = {}
+# Parsed articles per feed URL; lives only in process memory.
+_parsed: dict[str, list[Article]] = {}
+
+
+def _path(url: str, ext: str) -> str:
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.{ext}")
+
+
+def _body_path(url: str) -> str:
+    return _path(url, "xml")
+
+
+def _load_meta(url: str) -> dict | None:
+    """A feed's cached validators; each feed keeps its own small sidecar file."""
+    with _lock:
+        meta = _meta.get(url)
+    if meta is not None:
+        return meta
+    try:
+        with open(_path(url, "json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except Exception:
+        return None
+    if not isinstance(meta, dict):
+        return None
+    with _lock:
+        return _meta.setdefault(url, meta)
+
+
+def _write(path: str, data: bytes) -> None:
+    """Replace a file atomically; the temp name is per thread so writers don't collide."""
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+def conditional_headers(url: str) -> dict[str, str]:
+    """Return If-None-Match / If-Modified-Since headers for a cached feed."""
+    meta = _load_meta(url)
+    if not meta or not os.path.exists(_body_path(url)):
+        return {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def load_body(url: str) -> tuple[bytes, dict] | None:
+    """Return (raw_body, response_headers) for a cached feed, or None."""
+    meta = _load_meta(url)
+    if not meta:
+        return None
+    try:
+        with open(_body_path(url), "rb") as f:
+            body = f.read()
+    except OSError:
+        return None
+    headers = {}
+    if meta.get("content_type"):
+        headers["content-type"] = meta["content_type"]
+    return body, headers
+
+
+def store_response(
+    url: str,
+    body: bytes,
+    etag: str | None,
+    last_modified: str | None,
+    content_type: str | None = None,
+) -> None:
+    """Persist a fresh 200 response and drop any stale parsed entries.
+
+    Writes only this feed's body and sidecar, outside the module lock.
+    """
+    with _lock:
+        _parsed.pop(url, None)
+        _meta.pop(url, None)
+    meta = {
+        "url": url,
+        "etag": etag or "",
+        "last_modified": last_modified or "",
+        "content_type": content_type or "",
+        "size": len(body),
+    }
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _write(_body_path(url), body)
+        _write(_path(url, "json"), json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+    except OSError as e:
+        print(f"[WARNING] Failed to cache feed body for {url}: {e}")
+        return
+    with _lock:
+        _meta[url] = meta
+
+
+def has_parsed(url: str) -> bool:
+    """Whether articles parsed from the cached body are held in memory."""
+    with _lock:
+        return url in _parsed
+
+
+def get_parsed(url: str) -> list[Article] | None:
+    """Return copies of the articles parsed from the cached body, if any."""
+    with _lock:
+        cached = _parsed.get(url)
+    if cached is None:
+        return None
+    return [a.copy() for a in cached]
+
+
+def set_parsed(url: str, articles: list[Article]) -> None:
+    with _lock:
+        _parsed[url] = list(articles)
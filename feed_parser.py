@@ -0,0 +1,135 @@
+"""
+Feed Parser — Incremental RSS/Atom parsing that stops after the first N entries.
+Streams the document through an XML pull parser, decodes only the fields the
+aggregator uses, and discards each entry's subtree once read. Returns None
+for anything it cannot reproduce faithfully, in which case callers fall back
+to feedparser.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+_CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+
+_CHUNK = 16384
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _text(elem) -> str | None:
+    return None if elem is None else (elem.text or "").strip()
+
+
+def _parse_when(value: str | None) -> datetime | None:
+    """Parse an RFC 822 or ISO 8601 date to UTC, second precision."""
+    if not value:
+        return None
+    try:
+        if value[:4].isdigit():
+            dt = datetime.fromisoformat(value)
+        else:
+            dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        raise _Unsupported
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _rss_entry(item, ns: str) -> dict:
+    link = _text(item.find(f"{ns}link"))
+    if not link:
+        guid = item.find(f"{ns}guid")
+        if guid is not None and guid.get("isPermaLink", "true").lower() != "false":
+            link = _text(guid)
+    content = _text(item.find(f"{_CONTENT}encoded"))
+    summary = _text(item.find(f"{ns}description"))
+    date = _text(item.find(f"{ns}pubDate")) or _text(item.find(f"{_DC}date"))
+    return {
+        "title": _text(item.find(f"{ns}title")),
+        "link": link or "",
+        "summary": summary if summary is not None else (content or ""),
+        "content": content or "",
+        "published": _parse_when(date),
+    }
+
+
+def _atom_text(elem) -> str | None:
+    if elem is None:
+        return None
+    if elem.get("type") == "xhtml" or elem.get("src") or len(elem):
+        raise _Unsupported
+    return (elem.text or "").strip()
+
+
+def _atom_entry(entry) -> dict:
+    link = ""
+    for el in entry.findall(f"{_ATOM}link"):
+        if el.get("rel", "alternate") == "alternate":
+            link = (el.get("href") or "").strip()
+            break
+    if link and not link.startswith(("http://", "https://")):
+        raise _Unsupported  # relative to xml:base; feedparser resolves these
+    content = _atom_text(entry.find(f"{_ATOM}content"))
+    summary = _atom_text(entry.find(f"{_ATOM}summary"))
+    date = _text(entry.find(f"{_ATOM}published")) or _text(entry.find(f"{_ATOM}updated"))
+    return {
+        "title": _atom_text(entry.find(f"{_ATOM}title")),
+        "link": link,
+        "summary": summary if summary is not None else (content or ""),
+        "content": content or "",
+        "published": _parse_when(date),
+    }
+
+
+def parse_entries(body: bytes, limit: int, content_type: str = "") -> list[dict] | None:
+    """Return up to `limit` entries as {title, link, summary, content, published}.
+
+    title is None when the entry has no title element; published is a UTC
+    datetime or None. Returns None if the document is not well-formed
+    RSS 2.0 / RSS 1.0 / Atom 1.0 or uses a construct this parser does not
+    handle (xhtml content, relative links, unknown date formats, ...).
+    """
+    charset = content_type.lower().partition("charset=")[2].strip(" \"'")
+    if charset and charset not in ("utf-8", "utf8", "us-ascii") and b"encoding=" not in body[:200]:
+        # The HTTP charset overrides the XML default; leave that to feedparser.
+        return None
+    parser = XMLPullParser(events=("start", "end"))
+    entries: list[dict] = []
+    item_tag = None
+    ns = ""
+    try:
+        for start in range(0, len(body), _CHUNK):
+            parser.feed(body[start:start + _CHUNK])
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if item_tag is None:
+                        if elem.tag == "rss":
+                            item_tag, ns = "item", ""
+                        elif elem.tag == f"{_RDF}RDF":
+                            item_tag, ns = f"{_RSS1}item", _RSS1
+                        elif elem.tag == f"{_ATOM}feed":
+                            item_tag = f"{_ATOM}entry"
+                        else:
+                            return None
+                    continue
+                if elem.tag != item_tag:
+                    continue
+                if item_tag == f"{_ATOM}entry":
+                    entries.append(_atom_entry(elem))
+                else:
+                    entries.append(_rss_entry(elem, ns))
+                elem.clear()
+                if len(entries) >= limit:
+                    return entries
+        parser.close()
+    except (ParseError, _Unsupported):
+        return None
+    return entries if item_tag else None
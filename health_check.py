@@ -8,12 +8,12 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import feedparser
-import requests
 from openai import OpenAI
 
+import http_client
+import source_registry
 from config import (
-    FETCH_TIMEOUT,
-    NEWS_SOURCES,
+    FETCH_WORKERS,
     OPENAI_API_KEY,
     OPENAI_MODEL,
     SMTP_EMAIL,
@@ -25,7 +25,9 @@ def _check_rss(source: dict) -> dict:
     """Ping an RSS/Atom feed and verify it returns entries."""
     start = time.time()
     try:
-        feed = feedparser.parse(source["url"])
+        resp = http_client.get(source["url"])
+        resp.raise_for_status()
+        feed = feedparser.parse(resp.content, response_headers=dict(resp.headers))
         latency = round((time.time() - start) * 1000)
         if feed.bozo and not feed.entries:
             return {
@@ -61,10 +63,7 @@ def _check_hackernews(source: dict) -> dict:
     """Ping the Hacker News Firebase API."""
     start = time.time()
     try:
-        resp = requests.get(
-            f"{source['url']}topstories.json",
-            timeout=FETCH_TIMEOUT,
-        )
+        resp = http_client.get(f"{source['url']}topstories.json")
         latency = round((time.time() - start) * 1000)
         resp.raise_for_status()
         ids = resp.json()
@@ -183,9 +182,10 @@ def run_all_checks() -> list[dict]:
     """
     results: list[dict] = []
 
-    news_sources = list(NEWS_SOURCES)
+    news_sources = list(source_registry.get_sources())
 
-    with ThreadPoolExecutor(max_workers=len(news_sources) + 2) as pool:
+    # Bounded like the fetch workers; a large source list queues instead.
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(news_sources)) + 2) as pool:
         futures = {}
         for src in news_sources:
             fn = _check_hackernews if src["type"] == "hackernews" else _check_rss
@@ -207,7 +207,7 @@ def run_all_checks() -> list[dict]:
                     "latency_ms": 0,
                 })
 
-    source_order = [s["name"] for s in news_sources] + ["OpenAI", "Gmail SMTP"]
-    results.sort(key=lambda r: source_order.index(r["name"]) if r["name"] in source_order else 999)
+    source_order = {name: i for i, name in enumerate([s["name"] for s in news_sources] + ["OpenAI", "Gmail SMTP"])}
+    results.sort(key=lambda r: source_order.get(r["name"], len(source_order)))
 
     return results
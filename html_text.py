@@ -0,0 +1,202 @@
+"""
+HTML Text — Fast HTML-to-text conversion.
+clean_html strips feed summaries and content in a single regex pass, stopping
+as soon as the character cap is reached. Anything the fast path cannot
+reproduce exactly is handed to BeautifulSoup, so output always matches
+BeautifulSoup(html, "html.parser").get_text(separator=" ", strip=True).
+extract_main_text pulls the article body out of a full page by text density.
+"""
+
+import html
+import re
+from html.entities import html5
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+
+# Comments, script/style blocks, doctype / processing instructions, and tags.
+_MARKUP_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<(script|style)\b[^>]*>.*?</\1\s*>"
+    r"|<![A-Za-z][^>]*>"
+    r"|<\?[^>]*>"
+    r"|</?[A-Za-z][^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>",
+    re.S | re.I,
+)
+
+# Tags whose attributes html.parser reads the same way we skip over them.
+_STRICT_TAG_RE = re.compile(
+    r"</?[A-Za-z][^\s/>]*"
+    r"(?:\s+[^\s\"'>/=]+(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s\"'=<>`]+))?)*"
+    r"\s*/?>",
+)
+
+# Tags html.parser or BeautifulSoup treat specially; the fast path defers.
+_SPECIAL_TAG_RE = re.compile(r"</?(?:script|style|template)\b", re.I)
+
+_CHARREF_RE = re.compile(r"&(?:#[0-9]+;|#[xX][0-9a-fA-F]+;|([A-Za-z][A-Za-z0-9]*);)")
+_AMP_RE = re.compile(r"&[#A-Za-z]")
+
+
+class _Malformed(Exception):
+    pass
+
+
+def _decode(text: str) -> str:
+    """Decode character references, rejecting forms BeautifulSoup mangles."""
+    if "<" in text:
+        raise _Malformed
+    if "&" not in text:
+        return text
+    valid = {m.start() for m in _CHARREF_RE.finditer(text)
+             if m.group(1) is None or f"{m.group(1)};" in html5}
+    for m in _AMP_RE.finditer(text):
+        if m.start() not in valid:
+            raise _Malformed
+    return html.unescape(text)
+
+
+def _fast_text(raw_html: str, limit: int) -> str:
+    parts: list[str] = []
+    size = 0
+    pos = 0
+
+    def _take(run: str) -> bool:
+        nonlocal size
+        text = _decode(run).strip()
+        if text:
+            size += len(text) + (1 if parts else 0)
+            parts.append(text)
+        return size >= limit
+
+    for m in _MARKUP_RE.finditer(raw_html):
+        if m.start() > pos and _take(raw_html[pos:m.start()]):
+            return " ".join(parts)[:limit]
+        tag = m.group(0)
+        if tag[1] not in "!?" and m.group(1) is None:
+            if _SPECIAL_TAG_RE.match(tag) or not _STRICT_TAG_RE.fullmatch(tag):
+                raise _Malformed
+        pos = m.end()
+    if pos < len(raw_html):
+        _take(raw_html[pos:])
+    return " ".join(parts)[:limit]
+
+
+def clean_html(raw_html: str, limit: int = 3000) -> str:
+    """Return the visible text of an HTML fragment, at most `limit` characters."""
+    if not raw_html:
+        return ""
+    try:
+        return _fast_text(raw_html, limit)
+    except _Malformed:
+        soup = BeautifulSoup(raw_html, "html.parser")
+        return soup.get_text(separator=" ", strip=True)[:limit]
+
+
+# ── Main-content extraction ──────────────────────────────────────────────────
+
+# Subtrees never considered article text (the old extractor decomposed the
+# first seven; the rest never render as text). Not <form>: some CMSs, e.g.
+# ASP.NET WebForms, wrap the whole page body in one.
+_SKIP_TAGS = frozenset({
+    "script", "style", "nav", "footer", "header", "aside", "iframe",
+    "noscript", "svg", "template",
+})
+_BLOCK_TAGS = frozenset({
+    "p", "div", "article", "section", "main", "li", "ul", "ol", "blockquote",
+    "pre", "td", "tr", "table", "figure", "figcaption", "h1", "h2", "h3",
+    "h4", "h5", "h6", "br", "dd", "dt",
+})
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+})
+
+_MIN_BLOCK_CHARS = 40
+_MAX_LINK_DENSITY = 0.35
+_MIN_CONTENT_CHARS = 200
+
+
+class _DensityParser(HTMLParser):
+    """Split a page into text blocks, tracking how much of each is link text."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: list[tuple[str, float]] = []
+        self.dense_chars = 0
+        self._skip_depth = 0
+        self._link_depth = 0
+        self._parts: list[str] = []
+        self._link_chars = 0
+
+    def _flush(self) -> None:
+        if not self._parts:
+            return
+        text = " ".join(self._parts)
+        self._parts = []
+        link_density = self._link_chars / max(len(text), 1)
+        self._link_chars = 0
+        self.blocks.append((text, link_density))
+        if len(text) >= _MIN_BLOCK_CHARS and link_density <= _MAX_LINK_DENSITY:
+            self.dense_chars += len(text) + 1
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            if tag not in _VOID_TAGS:
+                self._skip_depth += 1
+            return
+        if tag in _BLOCK_TAGS:
+            self._flush()
+        if tag == "a":
+            self._link_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        if tag in _BLOCK_TAGS:
+            self._flush()
+        if tag == "a":
+            self._link_depth = max(self._link_depth - 1, 0)
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        text = data.strip()
+        if not text:
+            return
+        self._parts.append(text)
+        if self._link_depth:
+            self._link_chars += len(text)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def extract_main_text(page_html: str, limit: int = 4000) -> str:
+    """Extract the article text of a page by text density.
+
+    Keeps blocks that are long enough and mostly not link text, which drops
+    menus, link lists and boilerplate. Falls back to all visible text when
+    the page has too little dense text to judge.
+    """
+    if not page_html:
+        return ""
+    parser = _DensityParser()
+    chunk = 16384
+    try:
+        for start in range(0, len(page_html), chunk):
+            parser.feed(page_html[start:start + chunk])
+            if parser.dense_chars >= limit:
+                break
+        parser.close()
+    except Exception:
+        pass
+
+    dense = [t for t, density in parser.blocks
+             if len(t) >= _MIN_BLOCK_CHARS and density <= _MAX_LINK_DENSITY]
+    text = " ".join(dense)
+    if len(text) < _MIN_CONTENT_CHARS:
+        text = " ".join(t for t, _ in parser.blocks)
+    return text[:limit]
@@ -0,0 +1,144 @@
+"""
+HTTP Transport — Shared keep-alive connection pool for outbound requests.
+Keeps a keep-alive requests.Session for each recently used host, negotiates gzip/br compression, applies
+FETCH_TIMEOUT uniformly and records bytes transferred per host.
+"""
+
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import FETCH_TIMEOUT, HN_FETCH_CONCURRENCY
+
+USER_AGENT = "TechNewsAggregator/2.0"
+
+# urllib3 only decodes Brotli when one of these packages is installed.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# Enough connections per host for the Hacker News item fan-out.
+_POOL_SIZE = max(HN_FETCH_CONCURRENCY, 10)
+# Hosts with an open session; the least recently used one is closed beyond this.
+_MAX_SESSIONS = 64
+
+_lock = threading.Lock()
+_sessions: OrderedDict[str, requests.Session] = OrderedDict()
+_stats: dict[str, dict] = {}
+
+
+def _host(url: str) -> str:
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
+        return ""
+
+
+def _session_for(host: str) -> requests.Session:
+    evicted = None
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _sessions[host] = session
+            if len(_sessions) > _MAX_SESSIONS:
+                _, evicted = _sessions.popitem(last=False)
+        else:
+            _sessions.move_to_end(host)
+    if evicted is not None:
+        evicted.close()
+    return session
+
+
+# ── Byte accounting ──────────────────────────────────────────────────────────
+
+def record_transfer(url: str, wire_bytes: int, body_bytes: int) -> None:
+    """Add one response to the per-host counters.
+
+    wire_bytes is what crossed the network (compressed); body_bytes is the
+    decoded payload size.
+    """
+    host = _host(url)
+    with _lock:
+        s = _stats.setdefault(host, {"requests": 0, "wire_bytes": 0, "body_bytes": 0})
+        s["requests"] += 1
+        s["wire_bytes"] += wire_bytes
+        s["body_bytes"] += body_bytes
+
+
+def get_stats() -> dict[str, dict]:
+    """Return {host: {requests, wire_bytes, body_bytes}} since start."""
+    with _lock:
+        return {h: dict(s) for h, s in _stats.items()}
+
+
+def _wire_bytes(resp: requests.Response, fallback: int) -> int:
+    try:
+        return int(resp.raw.tell()) or fallback
+    except Exception:
+        return fallback
+
+
+# ── Requests ──────────────────────────────────────────────────────────────────
+
+def get(
+    url: str,
+    *,
+    headers: dict | None = None,
+    timeout: float | None = None,
+    stream: bool = False,
+) -> requests.Response:
+    """GET through the pooled session for url's host.
+
+    Streamed responses are not accounted automatically; callers report what
+    they actually read with record_transfer().
+    """
+    session = _session_for(_host(url))
+    resp = session.get(
+        url,
+        headers=headers,
+        timeout=timeout if timeout is not None else FETCH_TIMEOUT,
+        stream=stream,
+    )
+    if not stream:
+        body_len = len(resp.content)
+        record_transfer(url, _wire_bytes(resp, body_len), body_len)
+    return resp
+
+
+def read_capped(resp: requests.Response, max_bytes: int) -> bytes:
+    """Read a streamed response body, stopping once max_bytes are buffered.
+
+    The response is closed afterwards; what was read is accounted.
+    """
+    chunks: list[bytes] = []
+    size = 0
+    try:
+        for chunk in resp.iter_content(chunk_size=16384):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+    finally:
+        resp.close()
+    body = b"".join(chunks)[:max_bytes]
+    record_transfer(resp.url, _wire_bytes(resp, len(body)), len(body))
+    return body
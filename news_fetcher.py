@@ -4,18 +4,56 @@ Fetches tech news articles from RSS feeds and the Hacker News API.
 Includes deduplication, reading-time estimation, and concurrent fetching.
 """
 
+import heapq
+import itertools
 import math
+import multiprocessing
+import queue
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeout,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-from typing import Optional
+from pickle import PicklingError
+from typing import Callable, Iterator, Optional
 from urllib.parse import quote_plus, urlparse
 
 import feedparser
-import requests
-from bs4 import BeautifulSoup
 
-from config import FETCH_TIMEOUT, MAX_ARTICLES_PER_SOURCE, NEWS_SOURCES
+import article_store
+import feed_cache
+import feed_parser
+import http_client
+import source_health
+import source_registry
+from article_store import Article
+from config import (
+    ARTICLE_MAX_BYTES,
+    BODY_CACHE_MAX_MB,
+    BODY_CACHE_TTL,
+    FETCH_HEDGE,
+    FETCH_MODE,
+    FETCH_WORKERS,
+    HN_FETCH_CONCURRENCY,
+    HN_ITEM_TIMEOUT,
+    MAX_ARTICLES_PER_SOURCE,
+    PARSE_WORKERS,
+    WEB_SEARCH_CACHE_MAX_MB,
+    WEB_SEARCH_CACHE_TTL,
+)
+from dedup import DedupIndex
+from disk_cache import DiskCache
+from html_text import clean_html, extract_main_text
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -32,10 +70,7 @@ def _parse_date(entry: dict) -> Optional[datetime]:
 
 
 def _clean_html(raw_html: str) -> str:
-    if not raw_html:
-        return ""
-    soup = BeautifulSoup(raw_html, "html.parser")
-    return soup.get_text(separator=" ", strip=True)[:3000]
+    return clean_html(raw_html, 3000)
 
 
 def _reading_time(text: str) -> int:
@@ -51,204 +86,898 @@ def _extract_domain(url: str) -> str:
         return ""
 
 
-def _normalize(title: str) -> str:
-    """Lowercase, strip punctuation for dedup comparison."""
-    return re.sub(r"[^a-z0-9 ]", "", title.lower()).strip()
+# ── RSS Fetcher ───────────────────────────────────────────────────────────────
 
+def _download_feed(url: str, timeout: float | None = None) -> tuple[bytes, dict] | None:
+    """Download a feed with a conditional GET.
+
+    Returns (body, response_headers), or None when the server answered
+    304 Not Modified and the cached copy is still current.
+    """
+    resp = http_client.get(url, headers=feed_cache.conditional_headers(url), timeout=timeout)
+    if resp.status_code == 304:
+        if feed_cache.has_parsed(url):
+            return None
+        cached = feed_cache.load_body(url)
+        if cached is not None:
+            return cached
+        # Cache entry vanished between requests; fall back to a full download.
+        resp = http_client.get(url, timeout=timeout)
+    resp.raise_for_status()
+    feed_cache.store_response(
+        url, resp.content,
+        resp.headers.get("ETag"),
+        resp.headers.get("Last-Modified"),
+        resp.headers.get("Content-Type"),
+    )
+    return resp.content, dict(resp.headers)
 
-# ── RSS Fetcher ───────────────────────────────────────────────────────────────
 
-def _fetch_rss(source: dict) -> list[dict]:
+def _feed_entries(body: bytes, response_headers: dict) -> list[dict]:
+    """Raw fields of the first MAX_ARTICLES_PER_SOURCE entries of a feed.
+
+    Uses the incremental parser, which stops reading after those entries,
+    and falls back to feedparser for documents it does not handle.
+    """
+    content_type = next(
+        (v for k, v in response_headers.items() if k.lower() == "content-type"), "",
+    )
+    entries = feed_parser.parse_entries(body, MAX_ARTICLES_PER_SOURCE, content_type)
+    if entries is None:
+        entries = _feedparser_entries(body, response_headers, MAX_ARTICLES_PER_SOURCE)
+    return entries
+
+
+def _feedparser_entries(body: bytes, response_headers: dict, limit: int) -> list[dict]:
+    """feedparser version of feed_parser.parse_entries; handles any feed it can."""
+    entries = []
+    feed = feedparser.parse(body, response_headers=response_headers)
+    for entry in feed.entries[:limit]:
+        raw_description = ""
+        if hasattr(entry, "summary"):
+            raw_description = entry.summary
+        elif hasattr(entry, "description"):
+            raw_description = entry.description
+
+        raw_content = ""
+        if hasattr(entry, "content") and entry.content:
+            raw_content = entry.content[0].get("value", "")
+
+        entries.append({
+            "title": entry.get("title"),
+            "link": entry.get("link", ""),
+            "summary": raw_description,
+            "content": raw_content,
+            "published": _parse_date(entry),
+        })
+    return entries
+
+
+# ── Parse Stage ───────────────────────────────────────────────────────────────
+# Parsing and cleaning are CPU-bound pure Python, so threads gain nothing from
+# each other there. Downloads stay on threads / the event loop; raw bodies are
+# handed to a pool of PARSE_WORKERS processes that return compact records.
+
+# (fingerprint, entry key, fields) where fields is None for an entry the
+# store already holds with that fingerprint, else
+# (title, url, description, content, published, reading_time).
+_Record = tuple[str, str, Optional[tuple]]
+
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_lock = threading.Lock()
+# Set once a pool has parsed a feed; a pool that breaks before that is not
+# restarted (workers cannot start here), and parsing stays inline.
+_parse_pool_worked = False
+_parse_pool_disabled = False
+# One no-op task per worker of the current pool. Until they have all run,
+# workers are still starting, and feeds are parsed inline rather than
+# waiting (which would count process start-up as fetch latency).
+_parse_pool_warmup: list[Future] = []
+
+
+def _parse_records(body: bytes, response_headers: dict, known: dict[str, str]) -> list[_Record]:
+    """Parse and clean a feed body. Runs in a parse worker process.
+
+    known maps entry keys to the fingerprints already in the store; those
+    entries are returned without fields and are not cleaned again.
+    """
+    records = []
+    for entry in _feed_entries(body, response_headers):
+        raw_description = entry["summary"]
+        raw_content = entry["content"]
+        title = entry["title"] if entry["title"] is not None else "Untitled"
+        url = entry["link"]
+        published = entry["published"]
+        fp = article_store.fingerprint(
+            title, url, raw_description, raw_content,
+            published.isoformat() if published else "",
+        )
+        key = article_store.entry_key(url, title)
+        if known.get(key) == fp:
+            records.append((fp, key, None))
+            continue
+        description = _clean_html(raw_description)
+        content = _clean_html(raw_content)
+        full_text = content or description
+        records.append((fp, key, (
+            title, url, description, full_text, published, _reading_time(full_text),
+        )))
+    return records
+
+
+def _warm() -> None:
+    """Runs once in each new parse worker; importing this module is the work."""
+
+
+def _parse_executor() -> ProcessPoolExecutor | None:
+    global _parse_pool, _parse_pool_warmup
+    if PARSE_WORKERS <= 0 or _parse_pool_disabled:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # spawn, not fork: the parent runs the scheduler and HTTP threads.
+            _parse_pool = ProcessPoolExecutor(
+                PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+            )
+            _parse_pool_warmup = [_parse_pool.submit(_warm) for _ in range(PARSE_WORKERS)]
+        return _parse_pool
+
+
+def warm_parse_pool() -> None:
+    """Start the parse workers now, so they are ready before the first refresh."""
+    _parse_executor()
+
+
+def _run_parse(body: bytes, response_headers: dict, known: dict[str, str]) -> list[_Record]:
+    """Run _parse_records in the parse pool, or inline if it is disabled or broken."""
+    global _parse_pool, _parse_pool_worked, _parse_pool_disabled
+    pool = _parse_executor()
+    if pool is not None and all(f.done() for f in _parse_pool_warmup):
+        try:
+            records = pool.submit(_parse_records, body, response_headers, known).result()
+            _parse_pool_worked = True
+            return records
+        except (BrokenProcessPool, RuntimeError, OSError, PicklingError) as e:
+            # A dead worker, a pool that was shut down or could not start
+            # processes, or a payload that can't be pickled: parse this feed
+            # inline and replace the pool (or stop using it if it never worked).
+            with _parse_pool_lock:
+                if _parse_pool is pool:
+                    _parse_pool = None
+                    _parse_pool_disabled = not _parse_pool_worked
+                    action = "restarting the pool" if _parse_pool_worked else "parsing inline"
+                    print(f"[WARNING] Parse pool failed ({type(e).__name__}), {action}: {e}")
+                    pool.shutdown(wait=False, cancel_futures=True)
+    return _parse_records(body, response_headers, known)
+
+
+def _parse_rss(
+    source: dict, body: bytes, response_headers: dict, reuse: bool = True,
+) -> list[Article]:
+    """Build Articles from a raw feed body and merge them into the store.
+
+    Entries whose raw fields are unchanged since the last refresh are reused
+    from the article store instead of being cleaned again.
+    """
+    store = article_store.get_store()
+    known = store.fingerprints(source["name"]) if reuse else {}
+    records = _run_parse(body, response_headers, known)
     articles = []
-    try:
-        feed = feedparser.parse(source["url"])
-        for entry in feed.entries[:MAX_ARTICLES_PER_SOURCE]:
-            description = ""
-            if hasattr(entry, "summary"):
-                description = _clean_html(entry.summary)
-            elif hasattr(entry, "description"):
-                description = _clean_html(entry.description)
-
-            content = ""
-            if hasattr(entry, "content") and entry.content:
-                content = _clean_html(entry.content[0].get("value", ""))
-
-            full_text = content or description
-            url = entry.get("link", "")
-
-            articles.append({
-                "title": entry.get("title", "Untitled"),
-                "url": url,
-                "description": description,
-                "content": full_text,
-                "published": _parse_date(entry),
-                "source": source["name"],
-                "category": source["category"],
-                "domain": source.get("domain", _extract_domain(url)),
-                "reading_time": _reading_time(full_text),
-            })
-    except Exception as e:
-        print(f"[WARNING] Failed to fetch RSS from {source['name']}: {e}")
+    fingerprinted = []
+    for fp, key, fields in records:
+        if fields is None:
+            article = store.lookup(source["name"], key, fp)
+            if article is None:
+                # The stored entry changed while the feed was being parsed.
+                return _parse_rss(source, body, response_headers, reuse=False)
+        else:
+            title, url, description, content, published, reading_time = fields
+            article = Article(
+                title=title,
+                url=url,
+                description=description,
+                content=content,
+                published=published,
+                source=source["name"],
+                category=source["category"],
+                domain=source.get("domain", _extract_domain(url)),
+                reading_time=reading_time,
+            )
+        articles.append(article)
+        fingerprinted.append((fp, article))
+    store.merge(source["name"], fingerprinted)
+    feed_cache.set_parsed(source["url"], articles)
     return articles
 
 
+def _fetch_rss(source: dict, timeout: float | None = None) -> list[Article]:
+    downloaded = _download_feed(source["url"], timeout)
+    if downloaded is None:
+        return feed_cache.get_parsed(source["url"]) or []
+    return _parse_rss(source, *downloaded)
+
+
 # ── Hacker News Fetcher ──────────────────────────────────────────────────────
 
-def _fetch_hackernews(source: dict) -> list[dict]:
+def _hn_article(source: dict, item: dict | None) -> Article | None:
+    """Build an Article from a Hacker News item, or None if it is not a link story."""
+    if not item or item.get("type") != "story" or not item.get("url"):
+        return None
+    published = None
+    if item.get("time"):
+        published = datetime.fromtimestamp(item["time"], tz=timezone.utc)
+    url = item.get("url", "")
+    text = item.get("text", "") or ""
+    return Article(
+        title=item.get("title", "Untitled"),
+        url=url,
+        description=text[:500],
+        content=text[:3000],
+        published=published,
+        source=source["name"],
+        category=source["category"],
+        domain=source.get("domain", _extract_domain(url)),
+        reading_time=_reading_time(text),
+        score=item.get("score", 0),
+        comments=item.get("descendants", 0),
+    )
+
+
+def _merge_hackernews(source: dict, articles: list[Article]) -> None:
+    """Merge HN articles into the store; score and comment changes count as updates."""
+    article_store.get_store().merge(source["name"], [
+        (article_store.fingerprint(
+            a["title"], a["url"], a["content"],
+            str(a.get("score", 0)), str(a.get("comments", 0)),
+        ), a)
+        for a in articles
+    ])
+
+
+def _fetch_hn_item(base_url: str, sid: int, timeout: float = HN_ITEM_TIMEOUT) -> dict | None:
+    try:
+        r = http_client.get(f"{base_url}item/{sid}.json", timeout=timeout)
+        r.raise_for_status()
+        return r.json()
+    except Exception:
+        return None
+
+
+def _fetch_hackernews(source: dict, timeout: float | None = None) -> list[Article]:
     articles = []
     base_url = source["url"]
-    try:
-        resp = requests.get(f"{base_url}topstories.json", timeout=FETCH_TIMEOUT)
-        resp.raise_for_status()
-        story_ids = resp.json()[:MAX_ARTICLES_PER_SOURCE]
+    resp = http_client.get(f"{base_url}topstories.json", timeout=timeout)
+    resp.raise_for_status()
+    story_ids = resp.json()[:MAX_ARTICLES_PER_SOURCE]
+    item_timeout = min(HN_ITEM_TIMEOUT, timeout) if timeout else HN_ITEM_TIMEOUT
+
+    # Fan item requests out so the source costs ~one round trip, not N.
+    workers = max(1, min(HN_FETCH_CONCURRENCY, len(story_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        items = pool.map(lambda sid: _fetch_hn_item(base_url, sid, item_timeout), story_ids)
+        for item in items:
+            article = _hn_article(source, item)
+            if article:
+                articles.append(article)
+    _merge_hackernews(source, articles)
+    return articles
+
+
+# Per-source outcome of a refresh, as reported by last_fetch_status().
+COMPLETE = "complete"
+TIMED_OUT = "timed_out"
+FAILED = "failed"
+SKIPPED = "skipped"  # circuit open; stored articles are served
+
+# Workers for individual attempts, kept apart from the per-source workers so
+# a source waiting on its own hedged attempts cannot starve them.
+_attempt_pool = ThreadPoolExecutor(max_workers=2 * FETCH_WORKERS, thread_name_prefix="news-attempt")
+
 
-        for sid in story_ids:
+def _hedged_call(fn: Callable, source: dict, timeout: float) -> list[Article]:
+    """Run fn(source, timeout); if it outlives the source's p95, race a second try.
+
+    The first attempt to succeed wins. The loser finishes in the background
+    and its result is discarded (merging it again is a no-op).
+    """
+    delay = source_health.hedge_delay(source["name"]) if FETCH_HEDGE else None
+    if delay is None:
+        return fn(source, timeout)
+    first = _attempt_pool.submit(fn, source, timeout)
+    try:
+        return first.result(timeout=delay)
+    except FutureTimeout:
+        pass
+    pending = {first, _attempt_pool.submit(fn, source, timeout)}
+    error: Exception | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for f in done:
             try:
-                r = requests.get(f"{base_url}item/{sid}.json", timeout=FETCH_TIMEOUT)
-                r.raise_for_status()
-                item = r.json()
-                if item and item.get("type") == "story" and item.get("url"):
-                    published = None
-                    if item.get("time"):
-                        published = datetime.fromtimestamp(item["time"], tz=timezone.utc)
-                    url = item.get("url", "")
-                    text = item.get("text", "") or ""
-                    articles.append({
-                        "title": item.get("title", "Untitled"),
-                        "url": url,
-                        "description": text[:500],
-                        "content": text[:3000],
-                        "published": published,
-                        "source": source["name"],
-                        "category": source["category"],
-                        "domain": source.get("domain", _extract_domain(url)),
-                        "reading_time": _reading_time(text),
-                        "score": item.get("score", 0),
-                        "comments": item.get("descendants", 0),
-                    })
-            except Exception:
-                continue
+                return f.result()
+            except Exception as e:
+                error = e
+    raise error
+
+
+def _fetch_source(source: dict) -> tuple[str, list[Article]]:
+    """Fetch one source under its circuit breaker and adaptive timeout.
+
+    Returns (status, articles). articles is [] unless status is COMPLETE;
+    callers then serve the source's stored articles.
+    """
+    name = source["name"]
+    timeout = source_health.begin(name)
+    if timeout is None:
+        return SKIPPED, []
+    fn = _fetch_hackernews if source["type"] == "hackernews" else _fetch_rss
+    started = time.monotonic()
+    try:
+        batch = _hedged_call(fn, source, timeout)
     except Exception as e:
-        print(f"[WARNING] Failed to fetch Hacker News: {e}")
-    return articles
+        print(f"[WARNING] Failed to fetch {name}: {e or type(e).__name__}")
+        source_health.record_failure(name, str(e) or type(e).__name__)
+        return FAILED, []
+    source_health.record_success(name, time.monotonic() - started)
+    return COMPLETE, batch
 
 
 # ── Article body fetcher ─────────────────────────────────────────────────────
 
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([A-Za-z0-9_.:-]+)""", re.I)
+
+
+def _page_encoding(resp, head: bytes) -> str:
+    """Charset from the Content-Type header, else a <meta> tag, else UTF-8."""
+    content_type = resp.headers.get("Content-Type", "")
+    if "charset=" in content_type.lower() and resp.encoding:
+        return resp.encoding
+    m = _META_CHARSET_RE.search(head[:4096])
+    if m:
+        return m.group(1).decode("ascii", "ignore")
+    return "utf-8"
+
+
+_body_cache = DiskCache("bodies", BODY_CACHE_MAX_MB * 1024 * 1024, BODY_CACHE_TTL)
+
+
 def fetch_article_body(url: str) -> str:
+    """Main text of an article page, at most 4000 characters.
+
+    Served from the on-disk body cache when possible. Otherwise reads at
+    most ARTICLE_MAX_BYTES of the page, so multi-megabyte pages cost no
+    more than the part the extractor needs.
+    """
+    key = article_store.canonical_url(url)
+    cached = _body_cache.get(key) if key else None
+    if cached is not None:
+        return cached
+    text = _download_article_body(url)
+    if text and key:
+        _body_cache.set(key, text)
+    return text
+
+
+def body_cache_stats() -> dict:
+    """Hit/miss/eviction counters and size of the article body cache."""
+    return _body_cache.stats()
+
+
+def _download_article_body(url: str) -> str:
     try:
-        resp = requests.get(
-            url, timeout=FETCH_TIMEOUT,
-            headers={"User-Agent": "TechNewsAggregator/2.0"},
-        )
+        resp = http_client.get(url, stream=True)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside", "iframe"]):
-            tag.decompose()
-        text = soup.get_text(separator=" ", strip=True)
-        return text[:4000]
+        body = http_client.read_capped(resp, ARTICLE_MAX_BYTES)
+        try:
+            page = body.decode(_page_encoding(resp, body), errors="replace")
+        except LookupError:
+            page = body.decode("utf-8", errors="replace")
+        return extract_main_text(page, 4000)
     except Exception:
         return ""
 
 
 # ── Web news search (Google News RSS) ─────────────────────────────────────────
 
+# Words that do not change what a news search finds; dropped from cache keys
+# and from the query sent to Google.
+_QUERY_STOPWORDS = frozenset({
+    "a", "about", "an", "and", "any", "are", "at", "can", "could", "did", "do",
+    "does", "for", "from", "going", "has", "have", "hear", "heard", "how", "i",
+    "in", "is", "it", "know", "latest", "me", "news", "of", "on", "or",
+    "recent", "so", "tell", "that", "the", "there", "this", "to", "today", "up",
+    "was", "what", "when", "where", "which", "who", "why", "with",
+    "you", "your",
+})
+_QUERY_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+_POSSESSIVE_RE = re.compile(r"['’]s\b")
+
+_search_cache = DiskCache("web_search", WEB_SEARCH_CACHE_MAX_MB * 1024 * 1024, WEB_SEARCH_CACHE_TTL)
+_search_lock = threading.Lock()
+_search_inflight: dict[str, Future] = {}
+_search_coalesced = 0
+
+
+def _query_words(query: str) -> list[str]:
+    """Lowercased query words minus stopwords (all words if nothing is left)."""
+    text = _POSSESSIVE_RE.sub("", query.lower()).replace("'", "").replace("’", "")
+    words = [w.strip(".-") for w in _QUERY_WORD_RE.findall(text)]
+    words = [w for w in words if w]
+    return [w for w in words if w not in _QUERY_STOPWORDS] or words
+
+
+def normalize_query(query: str) -> str:
+    """Cache key for a search: case, stopwords, repeats and word order ignored."""
+    return " ".join(sorted(set(_query_words(query))))
+
+
 def search_web_news(query: str, max_results: int = 5) -> list[dict]:
-    """Search Google News RSS for recent articles about a topic (last 48 hours)."""
+    """Search Google News RSS for recent articles about a topic (last 48 hours).
+
+    Results are cached for WEB_SEARCH_CACHE_TTL seconds under the normalized
+    query, and concurrent searches for the same normalized query share one
+    request.
+    """
+    global _search_coalesced
+    key = f"{max_results}:{normalize_query(query)}"
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return [
+            {**r, "published": datetime.fromisoformat(r["published"]) if r["published"] else None}
+            for r in cached
+        ]
+
+    with _search_lock:
+        future = _search_inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _search_inflight[key] = Future()
+        else:
+            _search_coalesced += 1
+    if not leader:
+        return [dict(r) for r in future.result()]
+
+    results: list[dict] = []
     try:
-        search_url = (
-            f"https://news.google.com/rss/search?"
-            f"q={quote_plus(query)}+when:2d&hl=en-US&gl=US&ceid=US:en"
-        )
-        feed = feedparser.parse(search_url)
-        results = []
-        for entry in feed.entries[:max_results]:
-            source_name = ""
-            if hasattr(entry, "source"):
-                source_name = entry.source.get("title", "")
-
-            title = entry.get("title", "Untitled")
-            if source_name and title.endswith(f" - {source_name}"):
-                title = title[: -len(f" - {source_name}")]
-
-            results.append({
-                "title": title,
-                "url": entry.get("link", ""),
-                "description": _clean_html(entry.get("summary", "")),
-                "source": source_name,
-                "published": _parse_date(entry),
-            })
-        return results
+        results = _download_web_news(" ".join(_query_words(query)), max_results)
+        _search_cache.set(key, [
+            {**r, "published": r["published"].isoformat() if r["published"] else None}
+            for r in results
+        ])
     except Exception as e:
         print(f"[WARNING] Web news search failed: {e}")
-        return []
+    finally:
+        with _search_lock:
+            del _search_inflight[key]
+        future.set_result(results)
+    return [dict(r) for r in results]
+
+
+def search_cache_stats() -> dict:
+    """Web search cache counters, plus searches that joined an in-flight one."""
+    with _search_lock:
+        coalesced = _search_coalesced
+    return {**_search_cache.stats(), "coalesced": coalesced}
+
+
+def _download_web_news(query: str, max_results: int) -> list[dict]:
+    search_url = (
+        f"https://news.google.com/rss/search?"
+        f"q={quote_plus(query)}+when:2d&hl=en-US&gl=US&ceid=US:en"
+    )
+    resp = http_client.get(search_url)
+    resp.raise_for_status()
+    feed = feedparser.parse(resp.content, response_headers=dict(resp.headers))
+    results = []
+    for entry in feed.entries[:max_results]:
+        source_name = ""
+        if hasattr(entry, "source"):
+            source_name = entry.source.get("title", "")
+
+        title = entry.get("title", "Untitled")
+        if source_name and title.endswith(f" - {source_name}"):
+            title = title[: -len(f" - {source_name}")]
+
+        results.append({
+            "title": title,
+            "url": entry.get("link", ""),
+            "description": _clean_html(entry.get("summary", "")),
+            "source": source_name,
+            "published": _parse_date(entry),
+        })
+    return results
 
 
 # ── Deduplication ─────────────────────────────────────────────────────────────
 
-def _deduplicate(articles: list[dict]) -> list[dict]:
-    """Remove near-duplicate articles by normalized title similarity."""
-    seen: set[str] = set()
-    unique: list[dict] = []
-    for a in articles:
-        norm = _normalize(a["title"])
-        # Check for exact or prefix match
-        is_dup = False
-        for s in seen:
-            # If titles share >70 % of words, consider duplicate
-            words_a = set(norm.split())
-            words_s = set(s.split())
-            if not words_a or not words_s:
-                continue
-            overlap = len(words_a & words_s) / min(len(words_a), len(words_s))
-            if overlap > 0.7:
-                is_dup = True
-                break
-        if not is_dup:
-            seen.add(norm)
-            unique.append(a)
-    return unique
+def _deduplicate(articles: list[Article], index: DedupIndex | None = None) -> list[Article]:
+    """Remove near-duplicate articles by URL and normalized title similarity.
+
+    Pass the same `index` across calls to dedup batches incrementally.
+    """
+    if index is None:
+        index = DedupIndex()
+    return index.filter(articles)
 
 
 # ── Main entry point ─────────────────────────────────────────────────────────
 
+# Source selections whose merged view is kept; the least recently used goes first.
+_MAX_VIEWS = 8
+
+_view_lock = threading.Lock()
+# Sorted source names -> (their store versions, deduplicated view).
+_view_memo: OrderedDict[tuple, tuple[tuple, list[Article]]] = OrderedDict()
+# Per-source [(article, dedup keys)] for the store version they were built from.
+_source_memo: dict[str, tuple[int, list[tuple[Article, tuple]]]] = {}
+# Only used to compute dedup keys; never holds articles.
+_key_index = DedupIndex()
+
+
+def _source_entries(store: article_store.ArticleStore, name: str) -> list[tuple[Article, tuple]]:
+    """A source's stored articles, newest first, paired with their dedup keys."""
+    version = store.version(name)
+    with _view_lock:
+        memo = _source_memo.get(name)
+        if memo and memo[0] == version:
+            return memo[1]
+        articles = store.source_articles(name)
+        entries = list(zip(articles, _key_index.prepare(articles)))
+        _source_memo[name] = (version, entries)
+    return entries
+
+
+def _build_view(store: article_store.ArticleStore, names: list[str]) -> list[Article]:
+    """Merge stored per-source lists into one deduplicated, newest-first list.
+
+    Each source's articles and dedup keys are cached per store version, so a
+    new combination of sources only merges cached lists and replays the
+    index; an unchanged selection costs nothing beyond the lookup.
+    """
+    key = tuple(sorted(names))
+    versions = tuple(store.version(n) for n in key)
+    with _view_lock:
+        memo = _view_memo.get(key)
+        if memo and memo[0] == versions:
+            _view_memo.move_to_end(key)
+            return memo[1]
+
+    # Per-source lists are already sorted, so a k-way merge keeps the order.
+    merged = list(heapq.merge(
+        *(_source_entries(store, n) for n in key),
+        key=lambda e: e[0].get("published") or datetime.min.replace(tzinfo=timezone.utc),
+        reverse=True,
+    ))
+    view = DedupIndex().filter([a for a, _ in merged], [k for _, k in merged])
+    with _view_lock:
+        _view_memo[key] = (versions, view)
+        _view_memo.move_to_end(key)
+        # Views built from older store versions can never be served again.
+        for other, (built, _) in list(_view_memo.items()):
+            if built != tuple(store.version(n) for n in other):
+                del _view_memo[other]
+        while len(_view_memo) > _MAX_VIEWS:
+            _view_memo.popitem(last=False)
+    return view
+
+
+# Fetch priorities: lower runs first. Someone waiting on a fetch beats the
+# background refresh; within a tier, a source's own "priority" decides.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+class _FetchPool:
+    """A fixed number of long-lived worker threads fed from a priority queue.
+
+    Equal priorities run in submission order. Threads start on first use, so
+    importing this module (as parse workers do) creates none.
+    """
+
+    def __init__(self, workers: int, name: str):
+        self._workers = max(1, workers)
+        self._name = name
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        # Queued futures -> (priority, fn, args); removed once a worker takes one.
+        self._queued: dict[Future, tuple] = {}
+        self._started = False
+
+    def submit(self, priority: tuple, fn: Callable, *args) -> Future:
+        f: Future = Future()
+        with self._lock:
+            if not self._started:
+                for i in range(self._workers):
+                    threading.Thread(target=self._work, name=f"{self._name}-{i}", daemon=True).start()
+                self._started = True
+            self._queued[f] = (priority, fn, args)
+        self._queue.put((priority, next(self._seq), f))
+        return f
+
+    def promote(self, f: Future, priority: tuple) -> None:
+        """Move a still-queued future up to `priority` if that is more urgent."""
+        with self._lock:
+            entry = self._queued.get(f)
+            if entry is None or entry[0] <= priority:
+                return
+            self._queued[f] = (priority, entry[1], entry[2])
+        self._queue.put((priority, next(self._seq), f))
+
+    def queued(self) -> int:
+        with self._lock:
+            return len(self._queued)
+
+    def _work(self) -> None:
+        while True:
+            priority, _, f = self._queue.get()
+            with self._lock:
+                entry = self._queued.get(f)
+                # Already taken, or superseded by a promotion.
+                if entry is None or entry[0] != priority:
+                    continue
+                del self._queued[f]
+            if not f.set_running_or_notify_cancel():
+                continue
+            try:
+                f.set_result(entry[1](*entry[2]))
+            except BaseException as e:
+                f.set_exception(e)
+
+
+# Long-lived per-source workers. A source that misses a caller's deadline
+# keeps running here; its articles land in the store for the next call, and
+# that call joins the in-flight fetch instead of starting another one.
+_source_pool = _FetchPool(FETCH_WORKERS, "news-source")
+_inflight_lock = threading.Lock()
+_inflight: dict[str, Future] = {}
+_last_status: dict[str, str] = {}
+# Per-shard bookkeeping: {shard: {"sources", "in_flight", "refreshed", "failed", "last_done"}}
+# where sources / refreshed / failed are sets of source names.
+_shards: dict[int, dict] = {}
+
+
+def _shard(source: dict) -> dict:
+    shard = _shards.get(source.get("shard", 0))
+    if shard is None:
+        shard = _shards[source.get("shard", 0)] = {
+            "sources": set(), "in_flight": 0, "refreshed": set(), "failed": set(), "last_done": None,
+        }
+    shard["sources"].add(source["name"])
+    return shard
+
+
+def _track(source: dict, f: Future) -> None:
+    """Count a started fetch against its shard until it finishes."""
+    with _inflight_lock:
+        _shard(source)["in_flight"] += 1
+
+    def _done(f: Future) -> None:
+        try:
+            status = f.result()[0]
+        except Exception:
+            status = FAILED
+        with _inflight_lock:
+            shard = _shard(source)
+            shard["in_flight"] -= 1
+            shard["refreshed"].add(source["name"])
+            if status == FAILED:
+                shard["failed"].add(source["name"])
+            else:
+                shard["failed"].discard(source["name"])
+            shard["last_done"] = datetime.now(timezone.utc)
+
+    f.add_done_callback(_done)
+
+
+def fetch_progress() -> list[dict]:
+    """Refresh progress per shard.
+
+    Rows of {shard, sources, in_flight, refreshed, failed, last_done}:
+    sources fetched so far in this process, fetches running or queued,
+    sources that finished at least one fetch, sources whose latest fetch
+    failed, and when a fetch in the shard last finished.
+    """
+    with _inflight_lock:
+        return [{
+            "shard": n,
+            "sources": len(s["sources"]),
+            "in_flight": s["in_flight"],
+            "refreshed": len(s["refreshed"]),
+            "failed": len(s["failed"]),
+            "last_done": s["last_done"],
+        } for n, s in sorted(_shards.items())]
+
+
+# Resolves async-engine futures off the event loop, so their done-callbacks
+# (shard tracking, the scheduler's store save) never block it. One thread
+# keeps results in order, ahead of the end-of-run FAILED sweep.
+_async_done_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="news-async-done")
+
+
+def _run_async_engine(targets: list[dict], futures: dict[str, Future]) -> None:
+    """Hand targets to the shared async engine; each future resolves as its source finishes."""
+    def _on_source_done(name: str, status: str, batch: list[Article]) -> None:
+        _async_done_pool.submit(futures[name].set_result, (status, batch))
+
+    def _finished(run: Future | None) -> None:
+        if run is not None and not run.cancelled() and run.exception() is not None:
+            print(f"[WARNING] Async fetch engine failed: {run.exception()}")
+        for f in futures.values():
+            if not f.done():
+                f.set_result((FAILED, []))
+
+    try:
+        from async_fetcher import submit
+        submit(targets, _on_source_done).add_done_callback(
+            lambda run: _async_done_pool.submit(_finished, run))
+    except Exception as e:
+        print(f"[WARNING] Async fetch engine failed: {e}")
+        _finished(None)
+
+
+def _start_fetches(
+    targets: list[dict], priority: int = PRIORITY_INTERACTIVE,
+) -> dict[str, Future]:
+    """Start (or join in-flight) fetches; returns {source_name: Future[(status, articles)]}.
+
+    In threads mode, fetches queue for the FETCH_WORKERS source workers in
+    (priority, source priority) order; joining a queued fetch with a more
+    urgent priority moves it up.
+    """
+    futures: dict[str, Future] = {}
+    new: list[dict] = []
+    started: list[tuple[dict, Future]] = []
+    with _inflight_lock:
+        for src in targets:
+            rank = (priority, src.get("priority", 0))
+            f = _inflight.get(src["name"])
+            if f is None or f.done():
+                if FETCH_MODE == "asyncio":
+                    f = Future()
+                    f.set_running_or_notify_cancel()
+                    new.append(src)
+                else:
+                    f = _source_pool.submit(rank, _fetch_source, src)
+                _inflight[src["name"]] = f
+                started.append((src, f))
+            elif FETCH_MODE != "asyncio":
+                _source_pool.promote(f, rank)
+            futures[src["name"]] = f
+    for src, f in started:
+        _track(src, f)
+    if new:
+        _run_async_engine(new, {s["name"]: futures[s["name"]] for s in new})
+    return futures
+
+
+def _record_status(status: dict[str, str]) -> None:
+    with _inflight_lock:
+        _last_status.clear()
+        _last_status.update(status)
+
+
+def last_fetch_status() -> dict[str, str]:
+    """Per-source status of the latest refresh.
+
+    Values are "complete", "timed_out" (still loading in the background),
+    "failed", or "skipped" (circuit open). The latter three serve the
+    source's last stored articles.
+    """
+    with _inflight_lock:
+        return dict(_last_status)
+
+
 def fetch_all_news(
     sources: list[dict] | None = None,
     selected_sources: list[str] | None = None,
-) -> list[dict]:
+    deadline: float | None = None,
+) -> list[Article]:
     """
     Fetch news from all configured sources concurrently.
+    Uses a bounded pool of FETCH_WORKERS threads, or a single asyncio event
+    loop when FETCH_MODE is "asyncio".
     Returns deduplicated articles sorted by date (newest first).
+
+    With a deadline (seconds), returns once it expires with whatever has
+    finished; sources still running keep filling the store in the
+    background and show up on the next call. last_fetch_status() reports
+    how each source fared.
+
+    Fetched entries are merged into the persistent article store; sources
+    that fail keep serving their last stored articles. When no selected
+    source changed since the previous call, the previous result is reused
+    without re-running dedup or the sort.
     """
     if sources is None:
-        sources = NEWS_SOURCES
+        sources = source_registry.get_sources()
 
     targets = [
         s for s in sources
         if not selected_sources or s["name"] in selected_sources
     ]
 
-    all_articles: list[dict] = []
+    futures = _start_fetches(targets)
+    wait(futures.values(), timeout=deadline)
+    _record_status({
+        name: f.result()[0] if f.done() else TIMED_OUT
+        for name, f in futures.items()
+    })
 
-    # Concurrent fetch for speed
-    with ThreadPoolExecutor(max_workers=len(targets) or 1) as pool:
-        futures = {}
-        for src in targets:
-            fn = _fetch_hackernews if src["type"] == "hackernews" else _fetch_rss
-            futures[pool.submit(fn, src)] = src["name"]
+    store = article_store.get_store()
+    store.save()
+    return [a.copy() for a in _build_view(store, [t["name"] for t in targets])]
 
-        for future in as_completed(futures):
-            try:
-                all_articles.extend(future.result())
-            except Exception as e:
-                print(f"[WARNING] {futures[future]}: {e}")
 
-    # Deduplicate
-    all_articles = _deduplicate(all_articles)
+def last_refresh_delta() -> dict:
+    """Articles added and removed by refreshes since the previous call.
 
-    # Sort newest first
-    all_articles.sort(
-        key=lambda a: a.get("published") or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
-    return all_articles
+    Returns {"added": [...], "removed": [...]}; changed entries count as added.
+    Nothing is recorded until the first call, which returns empty lists.
+    """
+    return article_store.get_store().take_delta()
+
+
+def stored_news(
+    sources: list[dict] | None = None,
+    selected_sources: list[str] | None = None,
+) -> list[Article]:
+    """Deduplicated, newest-first articles from the store, without any network I/O.
+
+    The refresh scheduler keeps the store current; this is what page loads read.
+    """
+    if sources is None:
+        sources = source_registry.get_sources()
+    names = [
+        s["name"] for s in sources
+        if not selected_sources or s["name"] in selected_sources
+    ]
+    return [a.copy() for a in _build_view(article_store.get_store(), names)]
+
+
+def iter_news(
+    sources: list[dict] | None = None,
+    selected_sources: list[str] | None = None,
+    deadline: float | None = None,
+) -> Iterator[tuple[str, list[Article]]]:
+    """
+    Stream news source by source as each one finishes.
+    Yields (source_name, new_articles) where new_articles excludes anything
+    that duplicates an article yielded earlier. Sources that fail, or are
+    still running when the deadline (seconds) expires, yield their last
+    stored articles. Batches arrive in completion order, so callers sort
+    the combined list themselves.
+    """
+    if sources is None:
+        sources = source_registry.get_sources()
+
+    targets = [
+        s for s in sources
+        if not selected_sources or s["name"] in selected_sources
+    ]
+    if not targets:
+        return
+
+    futures = _start_fetches(targets)
+    names = {f: name for name, f in futures.items()}
+    status: dict[str, str] = {}
+    store = article_store.get_store()
+    index = DedupIndex()
+
+    def _batch(name: str, batch: list[Article]) -> list[Article]:
+        if not batch:
+            batch = store.source_articles(name)
+        return [a.copy() for a in _deduplicate(batch, index)]
+
+    try:
+        for f in as_completed(names, timeout=deadline):
+            name = names[f]
+            status[name], batch = f.result()
+            yield name, _batch(name, batch)
+    except FutureTimeout:
+        for name in futures:
+            if name not in status:
+                status[name] = TIMED_OUT
+                yield name, _batch(name, [])
+    _record_status(status)
+    store.save()
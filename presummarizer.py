@@ -0,0 +1,228 @@
+"""
+Pre-summarizer — Summarizes the stories readers are most likely to open.
+After refreshes, stored articles are ranked by recency, Hacker News score,
+how many sources carry the story and watchlist matches, and the top
+PRESUMMARIZE_TOP_N without a summary are summarized in the background,
+PRESUMMARIZE_CONCURRENCY at a time. Summaries go to a shared on-disk store
+that the Summarize buttons read before calling the model. The same pass
+classifies the sentiment of new headlines, which the page only reads.
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Iterator
+
+import article_store
+import source_registry
+from config import (
+    OPENAI_API_KEY,
+    PRESUMMARIZE_CONCURRENCY,
+    PRESUMMARIZE_TOP_N,
+    SUMMARY_CACHE_MAX_MB,
+    SUMMARY_CACHE_TTL,
+)
+from dedup import DedupIndex
+from disk_cache import DiskCache
+from news_fetcher import fetch_article_body
+from summarizer import analyze_sentiment, fallback_summary, model_summary, model_summary_stream
+
+# Articles with less text than this get their page fetched before summarizing.
+_MIN_CONTENT = 200
+# Seconds to let a burst of finished refreshes settle before ranking.
+_SETTLE = 5.0
+# Fewest seconds between the starts of two passes.
+_MIN_INTERVAL = 60.0
+# Watchlist keywords count for this long (seconds) after a session last used them.
+_WATCH_TTL = 86400
+# Ranking: recency halves every this many hours; an HN score of this many
+# points counts as much as a brand-new story.
+_HALF_LIFE_HOURS = 6.0
+_HN_FULL_SCORE = 500
+
+_summaries = DiskCache("summaries", SUMMARY_CACHE_MAX_MB * 1024 * 1024, SUMMARY_CACHE_TTL)
+
+_watch_lock = threading.Lock()
+_watchlist: dict[str, float] = {}
+
+_wake = threading.Event()
+_thread: threading.Thread | None = None
+_thread_lock = threading.Lock()
+# Store versions and watchlist the last pass ranked; a pass with the same
+# inputs would pick the same stories, so it is skipped.
+_last_pass: tuple | None = None
+
+
+# ── Summary store ─────────────────────────────────────────────────────────────
+
+def stored_summary(article: dict) -> str | None:
+    """The stored summary for an article, or None if it has not been made yet."""
+    entry = _summaries.get(article["id"])
+    if entry and entry["title"] == article["title"]:
+        return entry["summary"]
+    return None
+
+
+def _with_body(article: dict) -> dict:
+    article = article.copy()
+    if len(article.get("content", "")) < _MIN_CONTENT:
+        body = fetch_article_body(article["url"])
+        if body:
+            article["content"] = body
+    return article
+
+
+def _summarize_and_store(article: dict) -> str:
+    article = _with_body(article)
+    summary = model_summary(article)
+    _summaries.set(article["id"], {"title": article["title"], "summary": summary})
+    return summary
+
+
+def summarize_stream(article: dict) -> Iterator[str]:
+    """Stored summary if there is one; otherwise summarize now and store it.
+
+    A stored summary comes as one chunk; a fresh one is yielded as it is
+    written and stored once it completes. Fetches the article page first
+    when the feed gave little text. Falls back to the description
+    (unstored) without an API key, or on errors before any text arrived.
+    """
+    summary = stored_summary(article)
+    if summary is not None:
+        yield summary
+        return
+    if not OPENAI_API_KEY:
+        yield fallback_summary(article)
+        return
+    parts: list[str] = []
+    try:
+        for chunk in model_summary_stream(_with_body(article)):
+            parts.append(chunk)
+            yield chunk
+    except Exception as e:
+        print(f"[WARNING] Summarization failed: {e}")
+        if not parts:
+            yield fallback_summary(article)
+        return
+    _summaries.set(article["id"], {"title": article["title"], "summary": "".join(parts).strip()})
+
+
+# ── Ranking ───────────────────────────────────────────────────────────────────
+
+def watch(keywords: list[str]) -> None:
+    """Note a session's watchlist so matching stories are summarized first."""
+    now = time.time()
+    with _watch_lock:
+        for k in keywords:
+            _watchlist[k.lower()] = now
+
+
+def _watched() -> list[str]:
+    cutoff = time.time() - _WATCH_TTL
+    with _watch_lock:
+        for k in [k for k, t in _watchlist.items() if t < cutoff]:
+            del _watchlist[k]
+        return list(_watchlist)
+
+
+def rank(articles: list[dict], keywords: list[str] | None = None) -> list[dict]:
+    """One article per story, most summary-worthy first.
+
+    Duplicates across sources are folded into the story's first article
+    (pass articles newest first), and the number of distinct sources
+    carrying a story raises its rank.
+    """
+    groups = DedupIndex().cluster(articles)
+    sources: dict[int, set[str]] = {}
+    for article, first in zip(articles, groups):
+        if first >= 0:
+            sources.setdefault(first, set()).add(article.get("source", ""))
+
+    now = datetime.now(timezone.utc)
+    scored = []
+    for first, carriers in sources.items():
+        a = articles[first]
+        published = a.get("published")
+        age_hours = (now - published).total_seconds() / 3600 if published else 48.0
+        score = 0.5 ** (max(0.0, age_hours) / _HALF_LIFE_HOURS)
+        score += min(1.5, math.log1p(a.get("score") or 0) / math.log1p(_HN_FULL_SCORE))
+        score += 0.75 * (len(carriers) - 1)
+        if keywords:
+            text = (a["title"] + " " + a.get("description", "")).lower()
+            if any(k in text for k in keywords):
+                score += 1.0
+        scored.append((score, first))
+    scored.sort(key=lambda s: (-s[0], s[1]))
+    return [articles[i] for _, i in scored]
+
+
+# ── Background job ────────────────────────────────────────────────────────────
+
+def _stored_articles(sources: list[dict]) -> list[dict]:
+    store = article_store.get_store()
+    articles = [a for s in sources for a in store.source_articles(s["name"])]
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    articles.sort(key=lambda a: a.get("published") or oldest, reverse=True)
+    return articles
+
+
+def run_pass() -> int:
+    """Summarize the top-ranked stories that have no stored summary; returns how many.
+
+    First classifies the sentiment of stored headlines not classified yet.
+    Does nothing if no source's articles and no watchlist keyword changed
+    since the previous pass.
+    """
+    global _last_pass
+    store = article_store.get_store()
+    sources = source_registry.get_sources()
+    keywords = _watched()
+    inputs = (tuple((s["name"], store.version(s["name"])) for s in sources), tuple(sorted(keywords)))
+    if inputs == _last_pass:
+        return 0
+    _last_pass = inputs
+    articles = _stored_articles(sources)
+    analyze_sentiment(articles)
+    if PRESUMMARIZE_TOP_N <= 0:
+        return 0
+    top = rank(articles, keywords)[:PRESUMMARIZE_TOP_N]
+    todo = [a for a in top if stored_summary(a) is None]
+    if not todo:
+        return 0
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, PRESUMMARIZE_CONCURRENCY)) as pool:
+        for future in [pool.submit(_summarize_and_store, a) for a in todo]:
+            try:
+                future.result()
+                done += 1
+            except Exception as e:
+                print(f"[WARNING] Pre-summarization failed: {e}")
+    return done
+
+
+def _loop() -> None:
+    last_start = -_MIN_INTERVAL
+    while True:
+        _wake.wait()
+        time.sleep(max(_SETTLE, last_start + _MIN_INTERVAL - time.monotonic()))
+        _wake.clear()
+        last_start = time.monotonic()
+        try:
+            run_pass()
+        except Exception as e:
+            print(f"[WARNING] Pre-summarization pass failed: {e}")
+
+
+def kick() -> None:
+    """Ask for a pass soon; refreshes finishing close together share one pass,
+    and passes start at most once every _MIN_INTERVAL seconds."""
+    global _thread
+    if not OPENAI_API_KEY:
+        return
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_loop, name="news-presummarize", daemon=True)
+            _thread.start()
+    _wake.set()
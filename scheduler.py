@@ -0,0 +1,128 @@
+"""
+Refresh Scheduler — Background per-source refresh loop.
+One long-lived thread per process refreshes every registered source on
+its own interval (a source's "refresh_seconds", else REFRESH_SECONDS), with
+jitter so sources drift apart and exponential backoff after failures.
+Fetches queue at background priority for the bounded source workers.
+Results are published to the article store; the app only reads from it.
+Each completed refresh also prompts a background pre-summarization pass.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+
+import article_store
+import presummarizer
+import source_registry
+from config import REFRESH_JITTER, REFRESH_MAX_BACKOFF, REFRESH_SECONDS
+from news_fetcher import COMPLETE, FAILED, PRIORITY_BACKGROUND, _start_fetches, warm_parse_pool
+
+# Spread the first round over a few seconds instead of firing all at once.
+_STARTUP_SPREAD = 3.0
+# Write the store at most this often (seconds) while refreshes keep finishing.
+_SAVE_INTERVAL = 30.0
+
+
+class RefreshScheduler:
+    """Keeps every source's stored articles fresh without any session waiting."""
+
+    def __init__(self, sources: list[dict]):
+        self._sources = {s["name"]: s for s in sources}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        now = time.monotonic()
+        self._due = {name: now + random.uniform(0, _STARTUP_SPREAD) for name in self._sources}
+        self._running: set[str] = set()
+        self._failures: dict[str, int] = {}
+        self._last: dict[str, tuple[str, datetime]] = {}
+        self._saved_at = 0.0
+        self._thread = threading.Thread(target=self._loop, name="news-scheduler", daemon=True)
+
+    def start(self) -> "RefreshScheduler":
+        warm_parse_pool()
+        self._thread.start()
+        return self
+
+    def _interval(self, name: str) -> float:
+        return float(self._sources[name].get("refresh_seconds") or REFRESH_SECONDS)
+
+    def _loop(self) -> None:
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                due = [n for n, t in self._due.items() if t <= now and n not in self._running]
+                self._running.update(due)
+            if due:
+                futures = _start_fetches([self._sources[n] for n in due], PRIORITY_BACKGROUND)
+                for name, future in futures.items():
+                    future.add_done_callback(lambda f, n=name: self._finished(n, f))
+
+            with self._lock:
+                waiting = [t for n, t in self._due.items() if n not in self._running]
+            timeout = max(0.0, min(waiting) - time.monotonic()) if waiting else None
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def _finished(self, name: str, future: Future) -> None:
+        try:
+            status, _ = future.result()
+        except Exception as e:
+            print(f"[WARNING] Scheduled refresh of {name} failed: {e}")
+            status = FAILED
+        interval = self._interval(name)
+        with self._lock:
+            if status == FAILED:
+                failures = self._failures.get(name, 0) + 1
+                self._failures[name] = failures
+                delay = min(interval * 2 ** failures, max(REFRESH_MAX_BACKOFF, interval))
+            else:
+                self._failures[name] = 0
+                delay = interval
+            delay *= 1 + random.uniform(-REFRESH_JITTER, REFRESH_JITTER)
+            self._due[name] = time.monotonic() + delay
+            self._running.discard(name)
+            self._last[name] = (status, datetime.now(timezone.utc))
+            now = time.monotonic()
+            save = not self._running or now - self._saved_at >= _SAVE_INTERVAL
+            if save:
+                self._saved_at = now
+        if save:
+            article_store.get_store().save()
+        if status == COMPLETE:
+            presummarizer.kick()
+        self._wake.set()
+
+    def refreshed(self, names: list[str]) -> bool:
+        """True once every named source has completed at least one refresh."""
+        with self._lock:
+            return all(n in self._last for n in names if n in self._sources)
+
+    def status(self) -> list[dict]:
+        """Per-source schedule: last outcome, when it ran, and when it runs next."""
+        now = time.monotonic()
+        with self._lock:
+            return [{
+                "source": name,
+                "last_status": self._last.get(name, ("pending", None))[0],
+                "last_refresh": self._last.get(name, (None, None))[1],
+                "next_in_s": 0 if name in self._running else max(0, round(self._due[name] - now)),
+                "failures": self._failures.get(name, 0),
+            } for name in self._sources]
+
+
+_scheduler: RefreshScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def start_scheduler(sources: list[dict] | None = None) -> RefreshScheduler:
+    """Start the process-wide scheduler on first call and return it."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            if sources is None:
+                sources = source_registry.get_sources()
+            _scheduler = RefreshScheduler(sources).start()
+        return _scheduler
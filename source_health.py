@@ -0,0 +1,139 @@
+"""
+Source Health — Per-source latency history, adaptive timeouts and circuit breaker.
+Each source keeps a rolling window of fetch latencies and outcomes. Its
+timeout is derived from the observed p95, and after repeated failures its
+circuit opens so refreshes skip it (serving stored articles) until a
+half-open probe succeeds.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+
+from config import (
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURE_THRESHOLD,
+    FETCH_TIMEOUT,
+    MIN_FETCH_TIMEOUT,
+    TIMEOUT_P95_FACTOR,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_WINDOW = 50
+# Below this many successful samples the p95 is not trusted yet.
+_MIN_SAMPLES = 5
+
+
+class _Health:
+    __slots__ = ("latencies", "outcomes", "failures", "state", "opened_at", "last_error")
+
+    def __init__(self):
+        self.latencies: deque[float] = deque(maxlen=_WINDOW)
+        self.outcomes: deque[bool] = deque(maxlen=_WINDOW)
+        self.failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.last_error = ""
+
+    def p95(self) -> float | None:
+        if len(self.latencies) < _MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def timeout(self) -> float:
+        p95 = self.p95()
+        if p95 is None:
+            return float(FETCH_TIMEOUT)
+        return min(float(FETCH_TIMEOUT), max(MIN_FETCH_TIMEOUT, p95 * TIMEOUT_P95_FACTOR))
+
+
+_lock = threading.Lock()
+_health: dict[str, _Health] = {}
+
+
+def _get(name: str) -> _Health:
+    h = _health.get(name)
+    if h is None:
+        h = _health[name] = _Health()
+    return h
+
+
+def begin(name: str) -> float | None:
+    """Admit a fetch for a source.
+
+    Returns the timeout to use, or None when the circuit is open and the
+    source should be skipped. After CIRCUIT_COOLDOWN seconds an open
+    circuit lets exactly one probe through (half-open).
+    """
+    with _lock:
+        h = _get(name)
+        if h.state == OPEN:
+            if time.monotonic() - h.opened_at < CIRCUIT_COOLDOWN:
+                return None
+            h.state = HALF_OPEN
+            return h.timeout()
+        if h.state == HALF_OPEN:
+            # A probe is already in flight.
+            return None
+        return h.timeout()
+
+
+def record_success(name: str, latency: float) -> None:
+    with _lock:
+        h = _get(name)
+        h.latencies.append(latency)
+        h.outcomes.append(True)
+        h.failures = 0
+        h.state = CLOSED
+
+
+def record_failure(name: str, error: str = "") -> None:
+    with _lock:
+        h = _get(name)
+        h.outcomes.append(False)
+        h.failures += 1
+        h.last_error = error[:200]
+        if h.state == HALF_OPEN or h.failures >= CIRCUIT_FAILURE_THRESHOLD:
+            h.state = OPEN
+            h.opened_at = time.monotonic()
+
+
+def hedge_delay(name: str) -> float | None:
+    """Seconds after which a still-running fetch is past its typical latency.
+
+    This is the source's p95, or None while there is too little history
+    to say (or the p95 already reaches the timeout).
+    """
+    with _lock:
+        h = _health.get(name)
+        if h is None:
+            return None
+        p95 = h.p95()
+        if p95 is None or p95 >= h.timeout():
+            return None
+        return p95
+
+
+def snapshot() -> list[dict]:
+    """Current health of every source seen so far, for display."""
+    now = time.monotonic()
+    rows = []
+    with _lock:
+        for name, h in sorted(_health.items()):
+            p95 = h.p95()
+            rows.append({
+                "source": name,
+                "state": h.state,
+                "p95_ms": round(p95 * 1000) if p95 is not None else None,
+                "timeout_s": round(h.timeout(), 1),
+                "error_rate": round(h.outcomes.count(False) / len(h.outcomes), 2) if h.outcomes else 0.0,
+                "consecutive_failures": h.failures,
+                "retry_in_s": max(0, round(CIRCUIT_COOLDOWN - (now - h.opened_at))) if h.state == OPEN else 0,
+                "last_error": h.last_error,
+            })
+    return rows
@@ -0,0 +1,133 @@
+"""
+Source Registry — The list of news sources, loaded once and split into shards.
+Sources come from SOURCES_FILE (OPML, JSON or YAML) when it is set, else from
+NEWS_SOURCES in config.py. Each source gets a stable shard number, so refresh
+progress can be followed shard by shard on lists of thousands of feeds.
+"""
+
+import json
+import os
+import threading
+import zlib
+from xml.etree import ElementTree
+
+from config import NEWS_SOURCES, SOURCE_SHARDS, SOURCES_FILE
+
+DEFAULT_CATEGORY = "Uncategorized"
+
+
+def _normalize(raw: dict) -> dict | None:
+    """Fill in defaults for one source; None if it has no URL."""
+    url = str(raw.get("url") or "").strip()
+    if not url:
+        return None
+    source = dict(raw)
+    source["url"] = url
+    source["name"] = str(raw.get("name") or "").strip() or url
+    source["type"] = str(raw.get("type") or "rss").lower()
+    source["category"] = str(raw.get("category") or "").strip() or DEFAULT_CATEGORY
+    try:
+        source["priority"] = int(raw.get("priority") or 0)
+    except (TypeError, ValueError):
+        source["priority"] = 0
+    try:
+        source["shard"] = int(raw["shard"]) % SOURCE_SHARDS
+    except (KeyError, TypeError, ValueError):
+        source["shard"] = zlib.crc32(source["name"].encode("utf-8")) % SOURCE_SHARDS
+    return source
+
+
+def _from_opml(path: str) -> list[dict]:
+    """Feeds are <outline xmlUrl=...>; enclosing outlines name the category."""
+    sources: list[dict] = []
+
+    def walk(node, category: str) -> None:
+        for outline in node.findall("outline"):
+            label = outline.get("title") or outline.get("text") or ""
+            url = outline.get("xmlUrl")
+            if url:
+                # OPML 2.0 category attribute: comma-separated "/"-paths.
+                tagged = (outline.get("category") or "").split(",")[0].strip("/ ")
+                sources.append({
+                    "name": label,
+                    "url": url,
+                    "type": "hackernews" if outline.get("type") == "hackernews" else "rss",
+                    "category": tagged.rsplit("/", 1)[-1] or category,
+                    "priority": outline.get("priority"),
+                })
+            else:
+                walk(outline, label or category)
+
+    body = ElementTree.parse(path).getroot().find("body")
+    if body is not None:
+        walk(body, "")
+    return sources
+
+
+def _from_json(path: str) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("sources", []) if isinstance(data, dict) else data
+
+
+def _from_yaml(path: str) -> list[dict]:
+    try:
+        import yaml
+    except ImportError:
+        raise RuntimeError("PyYAML is required for YAML source files (pip install pyyaml)")
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    return data.get("sources", []) if isinstance(data, dict) else data
+
+
+def load_sources(path: str) -> list[dict]:
+    """Read sources from an OPML, JSON or YAML file, chosen by extension.
+
+    JSON and YAML files hold a list of source dicts (or {"sources": [...]})
+    with the same keys as NEWS_SOURCES. Sources without a URL are dropped;
+    of several sources with the same name, the first wins.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".opml", ".xml"):
+        raw = _from_opml(path)
+    elif ext in (".yaml", ".yml"):
+        raw = _from_yaml(path)
+    else:
+        raw = _from_json(path)
+
+    sources: list[dict] = []
+    seen: set[str] = set()
+    for item in raw or []:
+        source = _normalize(item) if isinstance(item, dict) else None
+        if source is None or source["name"] in seen:
+            continue
+        seen.add(source["name"])
+        sources.append(source)
+    skipped = len(raw or []) - len(sources)
+    if skipped:
+        print(f"[WARNING] Skipped {skipped} invalid or duplicate sources in {path}")
+    return sources
+
+
+_sources: list[dict] | None = None
+_sources_lock = threading.Lock()
+
+
+def get_sources() -> list[dict]:
+    """All configured sources, loaded on first use.
+
+    Falls back to NEWS_SOURCES if SOURCES_FILE is unset, unreadable or empty.
+    """
+    global _sources
+    with _sources_lock:
+        if _sources is None:
+            loaded: list[dict] = []
+            if SOURCES_FILE:
+                try:
+                    loaded = load_sources(SOURCES_FILE)
+                except Exception as e:
+                    print(f"[WARNING] Could not load sources from {SOURCES_FILE}: {e}")
+                if not loaded:
+                    print("[WARNING] No usable sources in SOURCES_FILE; using NEWS_SOURCES")
+            _sources = loaded or [s for s in map(_normalize, NEWS_SOURCES) if s]
+        return _sources
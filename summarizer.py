@@ -1,13 +1,33 @@
 """
 Summarizer Module — Agentic AI Core
 Uses OpenAI for intelligent summaries, trending-topic extraction,
-sentiment analysis, chat, and structured executive briefings.
+sentiment analysis, chat, and structured executive briefings. Briefings,
+article summaries and chat answers also come in *_stream variants that
+yield text as the model produces it.
 """
 
+import hashlib
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
 from openai import OpenAI
 
-from config import OPENAI_API_KEY, OPENAI_MODEL, SUMMARY_MAX_TOKENS
+from article_store import article_id
+from config import (
+    LLM_CACHE_MAX_MB,
+    LLM_CACHE_TTL,
+    OPENAI_API_KEY,
+    OPENAI_MODEL,
+    SENTIMENT_CACHE_MAX_MB,
+    SENTIMENT_CACHE_TTL,
+    SENTIMENT_CONCURRENCY,
+    SENTIMENT_RETRIES,
+    SENTIMENT_SHARD_SIZE,
+    SUMMARY_MAX_TOKENS,
+)
+from disk_cache import DiskCache
 
 _client: OpenAI | None = None
 
@@ -19,12 +39,136 @@ def _get_client() -> OpenAI:
     return _client
 
 
+# ── Response cache ────────────────────────────────────────────────────────────
+# Completions are keyed by a hash of everything that determines them, so
+# identical requests are answered from disk across restarts and workers.
+
+_llm_cache = DiskCache("llm", LLM_CACHE_MAX_MB * 1024 * 1024, LLM_CACHE_TTL)
+
+
+def _request(messages: list[dict], max_tokens: int, temperature: float, **params) -> tuple[dict, str]:
+    """The completion request and its cache key."""
+    request = {
+        "model": OPENAI_MODEL,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        **params,
+    }
+    key = hashlib.sha256(
+        json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+    ).hexdigest()
+    return request, key
+
+
+def _complete(
+    messages: list[dict],
+    max_tokens: int,
+    temperature: float,
+    check: Callable[[str], object] | None = None,
+    **params,
+) -> str:
+    """Return the stripped completion text, from the cache when possible.
+
+    Raises whatever the OpenAI client raises; failures are not cached. If
+    `check` is given, it runs on a fresh completion first and anything it
+    raises propagates, so e.g. malformed JSON is never replayed.
+    """
+    request, key = _request(messages, max_tokens, temperature, **params)
+    cached = _llm_cache.get(key)
+    if cached is not None:
+        return cached
+    response = _get_client().chat.completions.create(**request)
+    text = response.choices[0].message.content.strip()
+    if check is not None:
+        check(text)
+    _llm_cache.set(key, text)
+    return text
+
+
+def _json_object(text: str) -> dict:
+    """check= for replies that must be a JSON object."""
+    value = json.loads(text)
+    if not isinstance(value, dict):
+        raise ValueError(f"expected a JSON object, got {type(value).__name__}")
+    return value
+
+
+def _json_array(text: str) -> list:
+    """check= for replies that must be a JSON array."""
+    value = json.loads(text)
+    if not isinstance(value, list):
+        raise ValueError(f"expected a JSON array, got {type(value).__name__}")
+    return value
+
+
+def _stream(
+    messages: list[dict],
+    max_tokens: int,
+    temperature: float,
+    check: Callable[[str], object] | None = None,
+    **params,
+) -> Iterator[str]:
+    """Yield the completion text as it arrives; a cached completion is one chunk.
+
+    Shares _complete's cache: the stripped text is checked and stored once
+    the stream ends, so a stream that fails part-way is not cached.
+    """
+    request, key = _request(messages, max_tokens, temperature, **params)
+    cached = _llm_cache.get(key)
+    if cached is not None:
+        yield cached
+        return
+    parts: list[str] = []
+    for chunk in _get_client().chat.completions.create(**request, stream=True):
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not parts and delta:
+            delta = delta.lstrip()
+        if delta:
+            parts.append(delta)
+            yield delta
+    text = "".join(parts).strip()
+    if check is not None:
+        check(text)
+    _llm_cache.set(key, text)
+
+
+def llm_cache_stats() -> dict:
+    """Response cache counters plus hit_rate (hits / lookups, 0.0 before any)."""
+    stats = _llm_cache.stats()
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+
+def _article_key(article: dict) -> str:
+    """The article's stable ID, derived from its URL if it does not carry one."""
+    return article.get("id") or article_id(article.get("url", ""), article.get("title", ""))
+
+
 # ── Single-article summary ───────────────────────────────────────────────────
 
 def summarize_article(article: dict) -> str:
     if not OPENAI_API_KEY:
-        return _fallback_summary(article)
+        return fallback_summary(article)
+    try:
+        return model_summary(article)
+    except Exception as e:
+        print(f"[WARNING] Summarization failed: {e}")
+        return fallback_summary(article)
+
 
+def model_summary(article: dict) -> str:
+    """The model's summary of an article; raises if the request fails."""
+    return _complete(**_summary_request(article))
+
+
+def model_summary_stream(article: dict) -> Iterator[str]:
+    """model_summary as a stream of text chunks."""
+    return _stream(**_summary_request(article))
+
+
+def _summary_request(article: dict) -> dict:
     context_parts = [f"Title: {article['title']}"]
     if article.get("description"):
         context_parts.append(f"Description: {article['description'][:1200]}")
@@ -33,31 +177,24 @@ def summarize_article(article: dict) -> str:
     context_parts.append(f"Source: {article['source']}")
     context = "\n".join(context_parts)
 
-    try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a senior tech news analyst. Given an article, produce a summary "
-                        "in this exact format:\n\n"
-                        "**Summary:** 2-3 sentences covering the key facts.\n\n"
-                        "**Why it matters:** 1 sentence on the broader impact for the tech industry.\n\n"
-                        "**Key players:** Mention companies or people involved (comma-separated).\n\n"
-                        "Be concise, objective, and insightful."
-                    ),
-                },
-                {"role": "user", "content": context},
-            ],
-            max_tokens=SUMMARY_MAX_TOKENS,
-            temperature=0.25,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        print(f"[WARNING] Summarization failed: {e}")
-        return _fallback_summary(article)
+    return dict(
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "You are a senior tech news analyst. Given an article, produce a summary "
+                    "in this exact format:\n\n"
+                    "**Summary:** 2-3 sentences covering the key facts.\n\n"
+                    "**Why it matters:** 1 sentence on the broader impact for the tech industry.\n\n"
+                    "**Key players:** Mention companies or people involved (comma-separated).\n\n"
+                    "Be concise, objective, and insightful."
+                ),
+            },
+            {"role": "user", "content": context},
+        ],
+        max_tokens=SUMMARY_MAX_TOKENS,
+        temperature=0.25,
+    )
 
 
 # ── Executive briefing ───────────────────────────────────────────────────────
@@ -67,7 +204,30 @@ def summarize_all(articles: list[dict]) -> str:
         return "Set your OPENAI_API_KEY in the .env file to enable AI-powered summaries."
     if not articles:
         return "No articles available to summarize."
+    try:
+        return _complete(**_briefing_request(articles))
+    except Exception as e:
+        return f"Failed to generate briefing: {e}"
+
+
+def summarize_all_stream(articles: list[dict]) -> Iterator[str]:
+    """summarize_all, yielding the briefing as it is written."""
+    if not OPENAI_API_KEY:
+        yield "Set your OPENAI_API_KEY in the .env file to enable AI-powered summaries."
+        return
+    if not articles:
+        yield "No articles available to summarize."
+        return
+    started = False
+    try:
+        for chunk in _stream(**_briefing_request(articles)):
+            started = True
+            yield chunk
+    except Exception as e:
+        yield ("\n\n" if started else "") + f"Failed to generate briefing: {e}"
+
 
+def _briefing_request(articles: list[dict]) -> dict:
     digest_lines: list[str] = []
     for i, a in enumerate(articles, 1):
         line = f"{i}. [{a['source']}] {a['title']}"
@@ -76,35 +236,29 @@ def summarize_all(articles: list[dict]) -> str:
         digest_lines.append(line)
     digest = "\n".join(digest_lines)
 
-    try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are an expert tech news analyst producing a daily executive briefing. "
-                        "Given today's top tech headlines and descriptions, produce a structured "
-                        "briefing with these sections:\n\n"
-                        "**TOP STORIES** -- The 3-4 most significant stories. For each, give a "
-                        "2-sentence summary and explain why it matters.\n\n"
-                        "**TRENDS & THEMES** -- 2-3 emerging patterns or themes across the stories. "
-                        "Connect the dots between related articles.\n\n"
-                        "**MARKET SIGNALS** -- Any implications for investors, startups, or the "
-                        "broader tech ecosystem.\n\n"
-                        "**QUICK BITES** -- One-line summaries for remaining noteworthy articles.\n\n"
-                        "Use clear, direct language. Reference articles by number. Be insightful."
-                    ),
-                },
-                {"role": "user", "content": digest},
-            ],
-            max_tokens=1200,
-            temperature=0.35,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        return f"Failed to generate briefing: {e}"
+    return dict(
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "You are an expert tech news analyst producing a daily executive briefing. "
+                    "Given today's top tech headlines and descriptions, produce a structured "
+                    "briefing with these sections:\n\n"
+                    "**TOP STORIES** -- The 3-4 most significant stories. For each, give a "
+                    "2-sentence summary and explain why it matters.\n\n"
+                    "**TRENDS & THEMES** -- 2-3 emerging patterns or themes across the stories. "
+                    "Connect the dots between related articles.\n\n"
+                    "**MARKET SIGNALS** -- Any implications for investors, startups, or the "
+                    "broader tech ecosystem.\n\n"
+                    "**QUICK BITES** -- One-line summaries for remaining noteworthy articles.\n\n"
+                    "Use clear, direct language. Reference articles by number. Be insightful."
+                ),
+            },
+            {"role": "user", "content": digest},
+        ],
+        max_tokens=1200,
+        temperature=0.35,
+    )
 
 
 # ── Trending Topics Extraction ───────────────────────────────────────────────
@@ -115,9 +269,7 @@ def extract_trending_topics(articles: list[dict]) -> list[str]:
 
     headlines = " | ".join(a["title"] for a in articles[:40])
     try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
+        raw = _complete(
             messages=[
                 {
                     "role": "system",
@@ -132,8 +284,8 @@ def extract_trending_topics(articles: list[dict]) -> list[str]:
             ],
             max_tokens=150,
             temperature=0.2,
+            check=_json_array,
         )
-        raw = response.choices[0].message.content.strip()
         topics = json.loads(raw)
         if isinstance(topics, list):
             return [str(t) for t in topics[:10]]
@@ -144,65 +296,136 @@ def extract_trending_topics(articles: list[dict]) -> list[str]:
 
 # ── Sentiment Analysis ───────────────────────────────────────────────────────
 
+# Model-assigned sentiment per article: {id: {"title", "sentiment"}}. Only the
+# headline is classified, so an entry stays valid until the title changes.
+_sentiment_memo = DiskCache("sentiment", SENTIMENT_CACHE_MAX_MB * 1024 * 1024, SENTIMENT_CACHE_TTL)
+# Bumped whenever model sentiment is stored, so readers can cache lookups.
+_sentiment_version = 0
+
+
+def _classify(batch: list[dict]) -> dict[str, str]:
+    """One completion classifying every headline in batch; {article id: sentiment}."""
+    numbered = "\n".join(f"{i+1}. {a['title']}" for i, a in enumerate(batch))
+    raw = _complete(
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "Classify the sentiment of each tech news headline as exactly one of: "
+                    '"positive", "negative", or "neutral".\n'
+                    "Return ONLY a JSON object mapping headline number (as string) to sentiment.\n"
+                    'Example: {"1": "positive", "2": "negative", "3": "neutral"}\n'
+                    "No explanation. Just the JSON."
+                ),
+            },
+            {"role": "user", "content": numbered},
+        ],
+        max_tokens=500,
+        temperature=0.1,
+        check=_json_object,
+    )
+    parsed = json.loads(raw)
+    result: dict[str, str] = {}
+    for i, a in enumerate(batch):
+        s = parsed.get(str(i + 1), "neutral")
+        if s not in ("positive", "negative", "neutral"):
+            s = "neutral"
+        result[_article_key(a)] = s
+    return result
+
+
 def analyze_sentiment(articles: list[dict]) -> dict[str, str]:
     """
     Analyze sentiment for a batch of articles.
-    Returns {title: "positive" | "negative" | "neutral"} for each article.
+    Returns {article id: "positive" | "negative" | "neutral"} for each article.
+    Results are memoized per article, so only headlines not classified
+    before are sent to the model. Those are split into shards of
+    SENTIMENT_SHARD_SIZE, classified SENTIMENT_CONCURRENCY at a time; a
+    shard that fails (e.g. malformed JSON) is retried on its own and falls
+    back to keyword sentiment if it keeps failing.
     """
     if not OPENAI_API_KEY or not articles:
         return _fallback_sentiment(articles)
 
-    titles = [a["title"] for a in articles[:50]]
-    numbered = "\n".join(f"{i+1}. {t}" for i, t in enumerate(titles))
-
-    try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Classify the sentiment of each tech news headline as exactly one of: "
-                        '"positive", "negative", or "neutral".\n'
-                        "Return ONLY a JSON object mapping headline number (as string) to sentiment.\n"
-                        'Example: {"1": "positive", "2": "negative", "3": "neutral"}\n'
-                        "No explanation. Just the JSON."
-                    ),
-                },
-                {"role": "user", "content": numbered},
-            ],
-            max_tokens=500,
-            temperature=0.1,
-        )
-        raw = response.choices[0].message.content.strip()
-        parsed = json.loads(raw)
-        result: dict[str, str] = {}
-        for i, t in enumerate(titles):
-            s = parsed.get(str(i + 1), "neutral")
-            if s not in ("positive", "negative", "neutral"):
-                s = "neutral"
-            result[t] = s
+    result: dict[str, str] = {}
+    pending: list[dict] = []
+    for a in articles:
+        memo = _sentiment_memo.get(_article_key(a))
+        if memo and memo["title"] == a["title"]:
+            result[_article_key(a)] = memo["sentiment"]
+        else:
+            pending.append(a)
+    if not pending:
         return result
-    except Exception:
-        return _fallback_sentiment(articles)
+
+    shards = [
+        pending[i:i + SENTIMENT_SHARD_SIZE]
+        for i in range(0, len(pending), max(1, SENTIMENT_SHARD_SIZE))
+    ]
+    global _sentiment_version
+    workers = max(1, min(SENTIMENT_CONCURRENCY, len(shards)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for shard, classified in zip(shards, pool.map(_classify_shard, shards)):
+            if classified is None:
+                result.update(_fallback_sentiment(shard))
+                continue
+            for a in shard:
+                key = _article_key(a)
+                _sentiment_memo.set(key, {"title": a["title"], "sentiment": classified[key]})
+            _sentiment_version += 1
+            result.update(classified)
+    return result
+
+
+def stored_sentiment(articles: list[dict]) -> dict[str, str]:
+    """Sentiment without calling the model: {article id: sentiment}.
+
+    Uses what analyze_sentiment stored earlier, and keyword sentiment for
+    headlines it has not classified yet.
+    """
+    result: dict[str, str] = {}
+    pending: list[dict] = []
+    for a in articles:
+        memo = _sentiment_memo.get(_article_key(a)) if OPENAI_API_KEY else None
+        if memo and memo["title"] == a["title"]:
+            result[_article_key(a)] = memo["sentiment"]
+        else:
+            pending.append(a)
+    result.update(_fallback_sentiment(pending))
+    return result
+
+
+def sentiment_version() -> int:
+    """Changes whenever stored_sentiment could return something new."""
+    return _sentiment_version
+
+
+def _classify_shard(shard: list[dict]) -> dict[str, str] | None:
+    """_classify with up to SENTIMENT_RETRIES retries; None if every attempt fails."""
+    for attempt in range(SENTIMENT_RETRIES + 1):
+        try:
+            return _classify(shard)
+        except Exception as e:
+            print(f"[WARNING] Sentiment shard of {len(shard)} failed (attempt {attempt + 1}): {e}")
+    return None
 
 
 # ── Web search fallback for chat ──────────────────────────────────────────────
 
 def _enrich_from_web(
-    client: OpenAI,
     user_question: str,
     fallback_response: str,
-) -> tuple[list[dict], str]:
+) -> Iterator[str]:
     """Search Google News for the topic and build a response from real results.
 
-    Returns (web_results, response_text).
+    Yields the response text as it is written, then returns
+    (web_results, response_text) to the caller's `yield from`.
     """
     from news_fetcher import search_web_news
 
     web_results_raw = search_web_news(user_question, max_results=5)
     if not web_results_raw:
+        yield fallback_response
         return [], fallback_response
 
     web_context = "\n".join(
@@ -210,9 +433,9 @@ def _enrich_from_web(
         for r in web_results_raw
     )
 
+    parts: list[str] = []
     try:
-        web_resp = client.chat.completions.create(
-            model=OPENAI_MODEL,
+        for chunk in _stream(
             messages=[
                 {
                     "role": "system",
@@ -231,9 +454,13 @@ def _enrich_from_web(
             ],
             max_tokens=600,
             temperature=0.3,
-        )
-        response_text = web_resp.choices[0].message.content.strip()
+        ):
+            parts.append(chunk)
+            yield chunk
+        response_text = "".join(parts).strip()
     except Exception:
+        if not parts:
+            yield fallback_response
         response_text = fallback_response
 
     web_results = [
@@ -245,6 +472,54 @@ def _enrich_from_web(
 
 # ── Chat about the news ──────────────────────────────────────────────────────
 
+_FOUND_RE = re.compile(r'"found_in_articles"\s*:\s*true')
+
+
+class _JsonStringField:
+    """Decodes one string field of a JSON object while the object streams in.
+
+    feed() takes the next raw chunk and returns whatever new text of the
+    field's value it completes; escapes split across chunks wait for the rest.
+    """
+
+    def __init__(self, name: str):
+        self._start = re.compile(r'"%s"\s*:\s*"' % re.escape(name))
+        self._raw = ""
+        self._pos: int | None = None  # next undecoded character of the value
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        self._raw += chunk
+        if self._pos is None:
+            m = self._start.search(self._raw)
+            if not m:
+                return ""
+            self._pos = m.end()
+        raw, start, end = self._raw, self._pos, len(self._raw)
+        i = start
+        while i < end and not self.done:
+            if raw[i] == '"':
+                self.done = True
+            elif raw[i] != "\\":
+                i += 1
+            elif raw.startswith("\\u", i):
+                # A high surrogate is only decodable together with its pair.
+                high = raw[i + 2:i + 6].lower()
+                n = 12 if len(high) == 4 and "d800" <= high <= "dbff" else 6
+                if i + n > end:
+                    break
+                i += n
+            elif i + 2 <= end:
+                i += 2
+            else:
+                break
+        self._pos = i
+        try:
+            return json.loads(f'"{raw[start:i]}"', strict=False)
+        except ValueError:
+            return ""
+
+
 def chat_about_news(
     articles: list[dict],
     user_question: str,
@@ -252,7 +527,23 @@ def chat_about_news(
 ) -> dict:
     """
     Answer a user question about today's news using fetched articles as context.
-    Returns a dict with: found, matched_articles, brief, response.
+    Returns a dict with: found, matched_articles, web_results, brief, response.
+    """
+    for part in chat_about_news_stream(articles, user_question, history):
+        result = part
+    return result
+
+
+def chat_about_news_stream(
+    articles: list[dict],
+    user_question: str,
+    history: list[dict],
+) -> Iterator[str | dict]:
+    """
+    chat_about_news, yielding the response text as it is written and then
+    the result dict as the last item. Nothing is yielded before the model
+    has decided whether the answer is in today's articles, so the text is
+    always that of the final response.
     """
     empty_result = {
         "found": False, "matched_articles": [], "web_results": [],
@@ -263,10 +554,13 @@ def chat_about_news(
         empty_result["response"] = (
             "Set your OPENAI_API_KEY in the .env file to use the chat feature."
         )
-        return empty_result
+        yield empty_result["response"]
+        yield empty_result
+        return
 
+    shown = articles[:40]
     context_lines: list[str] = []
-    for i, a in enumerate(articles[:40], 1):
+    for i, a in enumerate(shown, 1):
         line = f"{i}. [{a['source']}] {a['title']}"
         desc = a.get("description", "")
         if desc:
@@ -303,27 +597,35 @@ def chat_about_news(
     messages.append({"role": "user", "content": user_question})
 
     try:
-        client = _get_client()
-        resp = client.chat.completions.create(
-            model=OPENAI_MODEL,
+        raw = ""
+        answer = _JsonStringField("response")
+        pending = ""
+        for chunk in _stream(
             messages=messages,
             max_tokens=800,
             temperature=0.4,
             response_format={"type": "json_object"},
-        )
-        raw = resp.choices[0].message.content.strip()
-        parsed = json.loads(raw)
-
+            check=_json_object,
+        ):
+            raw += chunk
+            pending += answer.feed(chunk)
+            # Off-feed answers are replaced by web results, so only stream found ones.
+            if pending and _FOUND_RE.search(raw):
+                yield pending
+                pending = ""
+        parsed = json.loads(raw.strip())
         found = parsed.get("found_in_articles", False)
         article_nums = parsed.get("article_numbers", [])
         brief = parsed.get("brief", "")
         response_text = parsed.get("response", "")
 
+        # Numbers refer to the prompt listing; resolve them to IDs right away.
         matched_articles = []
         for n in article_nums:
-            if isinstance(n, int) and 1 <= n <= len(articles):
-                a = articles[n - 1]
+            if isinstance(n, int) and 1 <= n <= len(shown):
+                a = shown[n - 1]
                 matched_articles.append({
+                    "id": _article_key(a),
                     "title": a["title"],
                     "url": a["url"],
                     "source": a["source"],
@@ -333,18 +635,19 @@ def chat_about_news(
                 })
 
         if not found:
-            web_results, response_text = _enrich_from_web(
-                client, user_question, response_text,
+            web_results, response_text = yield from _enrich_from_web(
+                user_question, response_text,
             )
-            return {
+            yield {
                 "found": False,
                 "matched_articles": [],
                 "web_results": web_results,
                 "brief": "",
                 "response": response_text,
             }
+            return
 
-        return {
+        yield {
             "found": True,
             "matched_articles": matched_articles,
             "web_results": [],
@@ -353,12 +656,13 @@ def chat_about_news(
         }
     except Exception as e:
         empty_result["response"] = f"Failed to get response: {e}"
-        return empty_result
+        yield empty_result
 
 
 # ── Fallbacks ─────────────────────────────────────────────────────────────────
 
-def _fallback_summary(article: dict) -> str:
+def fallback_summary(article: dict) -> str:
+    """The first sentences of the description, for when the model can't be used."""
     desc = article.get("description", "")
     if desc:
         sentences = desc.split(". ")
@@ -399,9 +703,9 @@ def _fallback_sentiment(articles: list[dict]) -> dict[str, str]:
         pos = len(words & positive_words)
         neg = len(words & negative_words)
         if pos > neg:
-            result[a["title"]] = "positive"
+            result[_article_key(a)] = "positive"
         elif neg > pos:
-            result[a["title"]] = "negative"
+            result[_article_key(a)] = "negative"
         else:
-            result[a["title"]] = "neutral"
+            result[_article_key(a)] = "neutral"
     return result